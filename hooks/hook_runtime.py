@@ -0,0 +1,224 @@
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [ "sh", "packaging>=25", "loguru" ]
+# [tool.uv]
+# exclude-newer = "2026-10-15T00:00:00Z"
+# ///
+"""Run a template hook in the environment shared by every hook.
+
+The inline script metadata above declares the dependencies of all
+three hooks, see hooks/README.md before changing it. pre_prompt
+installs this file in the template cache directory and each hook runs
+itself with `uv run --script hook_runtime.py <hook> [args]`.
+
+The hooks import the helpers below, which record the timings of a
+bake as Chrome trace events, from this module.
+
+A bake is identified in the trace events by an id made by pre_prompt.
+It is passed to the later hooks in a `<pid>.bake` file in the trace
+directory, keyed by the pid of the cookiecutter process which every
+hook launcher exports as PPC_BAKE_PID, and never in the cookiecutter
+context, where it would be saved and replayed.
+"""
+
+import hashlib
+import json
+import os
+import runpy
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+
+# Trace, spool and bake files older than this are removed when a bake's
+# trace is written.
+TRACE_TTL = 7 * 24 * 60 * 60
+
+_trace_lock = threading.Lock()
+
+_hook = "hook"
+_bake_id = "bake"
+
+
+def cache_dir() -> Path:
+    """Return the template cache directory, honoring XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "python-package-cookiecutter"
+
+
+def trace_dir() -> Path:
+    """Return the directory receiving trace files, set with PPC_TRACE_DIR."""
+    return Path(os.environ.get("PPC_TRACE_DIR") or cache_dir() / "traces")
+
+
+def _bake_file() -> Path | None:
+    """Return the file holding the id of the running bake, if known."""
+    pid = os.environ.get("PPC_BAKE_PID")
+    return trace_dir() / f"{pid}.bake" if pid else None
+
+
+def start_bake() -> str:
+    """Return the id of a new bake, recorded for the later hooks."""
+    bake_id = uuid.uuid4().hex
+    bake = _bake_file()
+    if bake is not None:
+        with suppress(OSError):
+            bake.parent.mkdir(parents=True, exist_ok=True)
+            bake.write_text(bake_id)
+    return bake_id
+
+
+def current_bake() -> str:
+    """Return the id of the bake recorded by pre_prompt.
+
+    Without one, fall back to a hash of the project directory which
+    pre_gen_project and post_gen_project share.
+    """
+    bake = _bake_file()
+    if bake is not None:
+        with suppress(OSError):
+            if bake_id := bake.read_text().strip():
+                return bake_id
+    return hashlib.sha256(str(Path.cwd()).encode()).hexdigest()[:16]
+
+
+def trace_event(event: dict) -> None:
+    """Append a Chrome trace event to this bake's trace spool file.
+
+    Tracing is best effort, failing to record an event is ignored.
+    """
+    with _trace_lock, suppress(OSError):
+        spool = trace_dir() / f"{_bake_id}.jsonl"
+        spool.parent.mkdir(parents=True, exist_ok=True)
+        with spool.open("a") as fp:
+            fp.write(json.dumps(event) + "\n")
+
+
+@contextmanager
+def span(name: str, **args: str) -> Iterator[None]:
+    """Record the start and duration of the enclosed block."""
+    ts = time.time_ns() // 1000
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace_event(
+            {
+                "name": name,
+                "cat": _hook,
+                "ph": "X",
+                "ts": ts,
+                "dur": int((time.perf_counter() - start) * 1_000_000),
+                "pid": os.getpid(),
+                "tid": threading.get_native_id(),
+                "args": args,
+            }
+        )
+
+
+def startup_seconds() -> float | None:
+    """Return the seconds since cookiecutter started this hook.
+
+    The hook runs as a child of uv, which replaced the shell started by
+    cookiecutter, so its start time is that of the parent process. The
+    start time is read from /proc, elsewhere None is returned.
+    """
+    try:
+        stat = Path(f"/proc/{os.getppid()}/stat").read_text()
+        uptime = float(Path("/proc/uptime").read_text().split()[0])
+    except (OSError, ValueError):
+        return None
+    # the command name is in parentheses and may contain spaces
+    command, _, fields = stat.partition(" (")[2].rpartition(") ")
+    if command != "uv":
+        return None
+    return uptime - int(fields.split()[19]) / os.sysconf("SC_CLK_TCK")
+
+
+def trace_setup(hook: str, bake_id: str) -> None:
+    """Record the events of hook as part of bake_id, and its startup.
+
+    The process is named after the hook in the trace and the startup
+    span covers launching this runtime and importing the hook's
+    dependencies.
+    """
+    global _hook, _bake_id
+    _hook, _bake_id = hook, bake_id
+
+    trace_event(
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": os.getpid(),
+            "args": {"name": hook},
+        }
+    )
+    startup = startup_seconds()
+    if startup is not None:
+        trace_event(
+            {
+                "name": "startup",
+                "cat": hook,
+                "ph": "X",
+                "ts": time.time_ns() // 1000 - int(startup * 1_000_000),
+                "dur": int(startup * 1_000_000),
+                "pid": os.getpid(),
+                "tid": threading.get_native_id(),
+                "args": {},
+            }
+        )
+
+
+def _prune_traces() -> None:
+    """Remove trace, spool and bake files older than TRACE_TTL seconds."""
+    for path in trace_dir().iterdir():
+        if path.suffix not in {".json", ".jsonl", ".bake"}:
+            continue
+        with suppress(OSError):
+            if time.time() - path.stat().st_mtime > TRACE_TTL:
+                path.unlink()
+
+
+def trace_report(name: str) -> None:
+    """Write the bake's Chrome trace and a timing summary to stdout.
+
+    The trace spool collected by every hook is converted to a Chrome
+    trace-event JSON file named after name and the bake, which can be
+    opened with Perfetto (https://ui.perfetto.dev) or chrome://tracing.
+    The bake is over, so its bake file is removed along with the files
+    of earlier bakes older than TRACE_TTL.
+
+    Raises OSError or ValueError if the spool cannot be read.
+    """
+    spool = trace_dir() / f"{_bake_id}.jsonl"
+    events = [json.loads(line) for line in spool.read_text().splitlines()]
+
+    trace = trace_dir() / f"{name}-{_bake_id}.json"
+    trace.write_text(json.dumps({"traceEvents": events}))
+    spool.unlink()
+    bake = _bake_file()
+    if bake is not None:
+        bake.unlink(missing_ok=True)
+    _prune_traces()
+
+    spans = sorted((e for e in events if e["ph"] == "X"), key=lambda e: e["ts"])
+    if not spans:
+        return
+    origin = spans[0]["ts"]
+
+    lines = [f"✨ {'step':<24} {'hook':<16} {'start':>8} {'duration':>9}"]
+    lines.extend(
+        f"✨ {event['name']:<24} {event['cat']:<16} "
+        f"{(event['ts'] - origin) / 1e6:7.2f}s {event['dur'] / 1e6:8.2f}s"
+        for event in spans
+    )
+    lines.append(f"✨ Trace written to {trace}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    sys.argv.pop(0)
+    runpy.run_path(sys.argv[0], run_name="__main__")
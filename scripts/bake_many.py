@@ -0,0 +1,314 @@
+#!/usr/bin/env -S uv run --quiet --script
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [ "cookiecutter", "sh", "packaging>=25", "loguru" ]
+# ///
+
+"""Generate many projects from a manifest of cookiecutter contexts.
+
+The manifest is a JSON or TOML file with an optional `defaults` table
+merged into every context and a list of `projects`, one context each:
+
+    [defaults]
+    full_name = "First Last"
+
+    [[projects]]
+    package_name = "alpha"
+
+    [[projects]]
+    package_name = "beta"
+    build_backend = "hatch"
+
+The projects are baked concurrently by a pool of processes. Before the
+pool starts, every development Python version is installed once and
+the `uvx ruff` tool environment is resolved once, so the bakes share
+them through a single uv cache instead of racing to create them.
+
+A JSON report with the outcome, duration and hook step timings of each
+project is written next to the projects, with one log file per project.
+
+    scripts/bake_many.py manifest.toml --output-dir projects --jobs 4
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tomllib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import sh
+from cookiecutter.main import cookiecutter as bake
+from loguru import logger
+from packaging.version import Version
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+
+# Contexts start from these values, a batch should not create GitHub
+# repositories unless the manifest asks for them.
+BATCH_DEFAULTS = {"create_github_repo": False}
+
+
+@dataclass
+class Job:
+    """A project to bake and where to bake it."""
+
+    name: str
+    context: dict
+    template: str
+    output_dir: Path
+    log: Path
+
+
+@dataclass
+class Result:
+    """The outcome of baking a project."""
+
+    name: str
+    status: str
+    seconds: float
+    log: str
+    path: str = ""
+    error: str = ""
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+def _logger_setup() -> None:
+    """Configure logger for the batch driver."""
+    logger.remove()
+    logger.add(
+        sys.stdout,
+        format="✨ {function:<15} | <level>{level:<8}</level>  | {message}",
+    )
+
+
+def load_manifest(path: Path) -> list[dict]:
+    """Return the cookiecutter contexts listed in the manifest at path.
+
+    Manifests ending in .toml are read as TOML, others as JSON. A JSON
+    manifest may also be a bare list of contexts.
+
+    Raises ValueError if the manifest lists no projects or more than
+    one project with the same package name.
+    """
+    if path.suffix == ".toml":
+        manifest = tomllib.loads(path.read_text())
+    else:
+        manifest = json.loads(path.read_text())
+
+    if isinstance(manifest, list):
+        manifest = {"projects": manifest}
+
+    defaults = BATCH_DEFAULTS | manifest.get("defaults", {})
+    contexts = [defaults | project for project in manifest.get("projects", [])]
+
+    if not contexts:
+        msg = f"{path} lists no projects"
+        raise ValueError(msg)
+
+    names = [context.get("package_name", "thing") for context in contexts]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        msg = f"{path} lists package names more than once: {duplicates}"
+        raise ValueError(msg)
+
+    return contexts
+
+
+def latest_python_version() -> str:
+    """Return the newest non-prerelease major.minor version uv knows of.
+
+    This is the development version pre_prompt offers by default.
+    """
+    versions = {
+        Version(info["version"])
+        for info in json.loads(str(sh.uv.python.list(output_format="json")))
+    }
+    latest = max(v for v in versions if not v.is_prerelease)
+    return f"{latest.major}.{latest.minor}"
+
+
+def prepare(contexts: list[dict]) -> dict[str, float]:
+    """Install what the bakes share once and return how long it took.
+
+    Contexts without a development Python version are given the one
+    pre_prompt would default to, so it is installed here too.
+    """
+    timings = {}
+    online = [context for context in contexts if not context.get("offline")]
+
+    if any("python_version_dev" not in context for context in contexts):
+        default = latest_python_version()
+        for context in contexts:
+            context.setdefault("python_version_dev", default)
+
+    versions = sorted({context["python_version_dev"] for context in online})
+    if versions:
+        start = time.perf_counter()
+        logger.info(f"Installing Python {', '.join(versions)}")
+        sh.uv.python.install(*versions)
+        timings["uv python install"] = time.perf_counter() - start
+
+    if online:
+        start = time.perf_counter()
+        logger.info("Resolving uvx ruff")
+        sh.uvx.ruff("--version")
+        timings["uvx ruff"] = time.perf_counter() - start
+
+    return timings
+
+
+def _trace_timings(trace_dir: Path) -> dict[str, float]:
+    """Return the duration in seconds of each hook step traced in trace_dir."""
+    timings = {}
+    for trace in trace_dir.glob("*.json"):
+        for event in json.loads(trace.read_text())["traceEvents"]:
+            if event["ph"] == "X":
+                timings[f"{event['cat']}:{event['name']}"] = event["dur"] / 1e6
+    return timings
+
+
+def bake_job(job: Job) -> Result:
+    """Bake a project, sending the output of it and its hooks to its log.
+
+    Runs in a worker process, failures are returned in the result.
+    """
+    result = Result(job.name, "ok", 0.0, str(job.log))
+    saved = [os.dup(1), os.dup(2)]
+
+    with tempfile.TemporaryDirectory() as trace_dir, job.log.open("w") as log:
+        os.environ["PPC_TRACE_DIR"] = trace_dir
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+        start = time.perf_counter()
+        try:
+            result.path = bake(
+                template=job.template,
+                no_input=True,
+                extra_context=job.context,
+                output_dir=job.output_dir,
+            )
+        except Exception as error:
+            result.status = "failed"
+            result.error = f"{type(error).__name__}: {error}"
+        finally:
+            result.seconds = time.perf_counter() - start
+            sys.stdout.flush()
+            sys.stderr.flush()
+            for fd, target in zip(saved, [1, 2], strict=True):
+                os.dup2(fd, target)
+                os.close(fd)
+        result.timings = _trace_timings(Path(trace_dir))
+
+    return result
+
+
+def bake_many(
+    contexts: list[dict],
+    output_dir: Path,
+    template: str,
+    jobs: int | None,
+) -> dict:
+    """Bake the contexts concurrently and return the report of the batch."""
+    start = time.perf_counter()
+    setup = prepare(contexts)
+
+    log_dir = output_dir / "bake-logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    batch = [
+        Job(
+            name=context.get("package_name", "thing"),
+            context=context,
+            template=template,
+            output_dir=output_dir,
+            log=log_dir / f"{context.get('package_name', 'thing')}.log",
+        )
+        for context in contexts
+    ]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for result in pool.map(bake_job, batch):
+            if result.status == "ok":
+                logger.success(f"{result.name:<24} {result.seconds:7.2f}s")
+            else:
+                logger.error(f"{result.name:<24} {result.error}, see {result.log}")
+            results.append(result)
+
+    return {
+        "template": template,
+        "uv_cache_dir": os.environ["UV_CACHE_DIR"],
+        "workers": jobs or os.cpu_count(),
+        "setup": setup,
+        "seconds": time.perf_counter() - start,
+        "projects": [asdict(result) for result in results],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Bake the projects of a manifest and write the batch report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("manifest", type=Path, help="JSON or TOML manifest")
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path(),
+        help="directory receiving the projects (default: current directory)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of concurrent bakes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--template",
+        default=str(TEMPLATE_ROOT),
+        help="template to bake (default: this checkout)",
+    )
+    parser.add_argument(
+        "--uv-cache-dir",
+        type=Path,
+        default=None,
+        help="uv cache shared by the bakes (default: uv's own cache)",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        default=None,
+        help="report path (default: OUTPUT_DIR/bake-report.json)",
+    )
+    args = parser.parse_args(argv)
+
+    _logger_setup()
+
+    contexts = load_manifest(args.manifest)
+    output_dir = args.output_dir.resolve()
+
+    # Every bake and every uv command run by the hooks inherit this.
+    cache_dir = args.uv_cache_dir or os.environ.get("UV_CACHE_DIR")
+    os.environ["UV_CACHE_DIR"] = str(cache_dir or sh.uv.cache.dir().strip())
+
+    report = bake_many(contexts, output_dir, args.template, args.jobs)
+
+    report_path = args.report or output_dir / "bake-report.json"
+    report_path.write_text(json.dumps(report, indent=2) + "\n")
+
+    failed = [p for p in report["projects"] if p["status"] != "ok"]
+    logger.info(
+        f"Baked {len(report['projects']) - len(failed)} of "
+        f"{len(report['projects'])} projects in {report['seconds']:.2f}s, "
+        f"report written to {report_path}"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
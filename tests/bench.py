@@ -0,0 +1,91 @@
+"""Summarize benchmark timings and compare them with a baseline.
+
+A run is only reported as a regression when its median is slower than
+the baseline median by more than a relative threshold and by more
+than a number of standard deviations, so ordinary run to run noise
+does not fail the benchmarks.
+"""
+
+import json
+import platform
+import statistics
+from dataclasses import dataclass
+from pathlib import Path
+
+# Timings this short are dominated by noise and never compared.
+MIN_SECONDS = 0.005
+
+
+@dataclass
+class Regression:
+    """A metric that got slower than its baseline."""
+
+    context: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        """Describe the regression."""
+        change = (self.current - self.baseline) / self.baseline
+        return (
+            f"{self.context} {self.metric}: "
+            f"{self.baseline:.3f}s -> {self.current:.3f}s ({change:+.0%})"
+        )
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Return statistics describing samples of a timing in seconds."""
+    return {
+        "rounds": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def compare(
+    context: str,
+    baseline: dict[str, dict[str, float]],
+    current: dict[str, dict[str, float]],
+    threshold: float,
+    sigmas: float = 3.0,
+) -> list[Regression]:
+    """Return the metrics of current that regressed from baseline.
+
+    Metrics missing from the baseline, e.g. new hook steps, are skipped.
+    """
+    regressions = []
+    for metric, now in current.items():
+        then = baseline.get(metric)
+        if then is None or then["median"] < MIN_SECONDS:
+            continue
+        slower = now["median"] - then["median"]
+        noise = sigmas * max(then["stdev"], now["stdev"])
+        if slower > threshold * then["median"] and slower > noise:
+            regressions.append(
+                Regression(context, metric, then["median"], now["median"])
+            )
+    return regressions
+
+
+def load_baseline(path: Path) -> dict:
+    """Return the baseline stored at path, empty if there is none."""
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return {"machine": {}, "contexts": {}}
+
+
+def save_baseline(path: Path, context: str, metrics: dict) -> None:
+    """Store the metrics of context in the baseline at path."""
+    baseline = load_baseline(path)
+    baseline["machine"] = {
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+    }
+    baseline["contexts"][context] = metrics
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
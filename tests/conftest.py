@@ -1,13 +1,37 @@
 """python-package-cookiecutter testing fixtures."""
 
+import hashlib
 import json
+import os
+import shutil
+import subprocess
+import tarfile
+import time
+import zipfile
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from email.message import Message
+from email.parser import Parser
 from pathlib import Path
+from types import ModuleType
 
+import cookiecutter
 import pytest
 from cookiecutter.main import cookiecutter as bake
+from filelock import FileLock
+
+from .hook_harness import FakeTools, load_hook
+from .pairwise import covering_array, full_product, option_space
 
 _PROJECT = "python-package-cookiecutter"
 
+# Template paths whose contents determine the baked project.
+_TEMPLATE_INPUTS = ["cookiecutter.json", "hooks", "{{ cookiecutter.package_name }}"]
+
+# Cached bakes unused for this long are removed when a new one is saved.
+BAKE_TTL = 7 * 24 * 60 * 60
+
 # Base manifest that all projects should have
 BASE_MANIFEST = [
     ("is_dir", ".git"),
@@ -15,6 +39,7 @@ BASE_MANIFEST = [
     ("is_dir", ".github/ISSUE_TEMPLATE"),
     ("is_dir", ".github/workflows"),
     ("is_dir", ".venv"),
+    ("is_dir", "benchmarks"),
     ("is_dir", "src"),
     ("is_dir", "tests"),
     ("is_file", ".envrc"),
@@ -28,11 +53,22 @@ BASE_MANIFEST = [
     ("is_file", ".github/workflows/release.yaml"),
     ("is_file", ".gitignore"),
     ("is_file", "README.md"),
+    ("is_file", "benchmarks/__init__.py"),
+    ("is_file", "benchmarks/__main__.py"),
+    ("is_file", "benchmarks/bench_cli.py"),
+    ("is_file", "benchmarks/harness.py"),
     ("is_file", "pyproject.toml"),
     ("is_file", "uv.lock"),
 ]
 
-BASE_SRC = ["__init__.py", "__main__.py", "self_subcommand.py"]
+BASE_SRC = [
+    "__init__.py",
+    "__main__.py",
+    "instrument.py",
+    "lazy_typer.py",
+    "profiling.py",
+    "self_subcommand.py",
+]
 
 
 def generate_expected_manifest(cookiecutter_context: dict) -> list[tuple[str, str]]:
@@ -69,7 +105,11 @@ def generate_expected_src_files(cookiecutter_context: dict) -> list[str]:
 
     # Add settings.py if pydantic-settings is enabled
     if cookiecutter_context.get("use_pydantic_settings", True):
-        src_files.append("settings.py")
+        src_files.extend(["cached_settings.py", "settings.py"])
+
+    # Add log_sinks.py if logging to a file is enabled
+    if cookiecutter_context.get("log_to_file", True):
+        src_files.append("log_sinks.py")
 
     return src_files
 
@@ -108,6 +148,269 @@ def check_project_contents(
     return True
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add options controlling the baked project cache."""
+    group = parser.getgroup("bake", "baked project cache")
+    group.addoption(
+        "--no-bake-cache",
+        action="store_true",
+        default=False,
+        help="Bake every project from scratch instead of reusing cached bakes.",
+    )
+    group.addoption(
+        "--bake-cache-dir",
+        type=Path,
+        default=None,
+        help="Directory holding cached bakes, defaults to the user cache.",
+    )
+
+    parser.addoption(
+        "--update-snapshots",
+        action="store_true",
+        default=False,
+        help="Rewrite the golden snapshots of the rendered template.",
+    )
+
+    group = parser.getgroup("bench", "generation benchmarks")
+    group.addoption(
+        "--bench",
+        action="store_true",
+        default=False,
+        help="Run the generation benchmarks.",
+    )
+    group.addoption(
+        "--bench-update",
+        action="store_true",
+        default=False,
+        help="Record the benchmark results as the new baseline.",
+    )
+    group.addoption(
+        "--bench-rounds",
+        type=int,
+        default=3,
+        help="Number of measured bakes per benchmark context.",
+    )
+    group.addoption(
+        "--bench-warmup",
+        type=int,
+        default=1,
+        help="Number of bakes per benchmark context run before measuring.",
+    )
+    group.addoption(
+        "--bench-threshold",
+        type=float,
+        default=0.25,
+        help="Relative slow down of a median treated as a regression.",
+    )
+
+    group = parser.getgroup("matrix", "configuration matrix")
+    group.addoption(
+        "--matrix",
+        choices=["pairwise", "full"],
+        default="pairwise",
+        help="Bake a covering array of option values or every combination.",
+    )
+    group.addoption(
+        "--matrix-strength",
+        type=int,
+        default=2,
+        help="Cover every combination of values of this many options.",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize matrix_context with contexts drawn from cookiecutter.json."""
+    if "matrix_context" not in metafunc.fixturenames:
+        return
+
+    config = metafunc.config
+    cookiecutter_json = json.loads((config.rootpath / "cookiecutter.json").read_text())
+    space = option_space(cookiecutter_json)
+
+    if config.getoption("--matrix") == "full":
+        contexts = full_product(space)
+    else:
+        contexts = covering_array(space, config.getoption("--matrix-strength"))
+
+    metafunc.parametrize(
+        "matrix_context",
+        contexts,
+        ids=[f"context{n:04d}" for n in range(len(contexts))],
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Assign xdist groups when running with --dist loadgroup.
+
+    Tests sharing a built_artifacts backend run on one worker so the
+    artifacts are built once, and slow or integration tests are dealt
+    round-robin to as many groups as there are workers so the heavy
+    bakes spread across cores.
+    """
+    workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "0"))
+    if not workers:
+        return
+
+    heavy = 0
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec and "built_artifacts" in callspec.params:
+            group = f"built_artifacts-{callspec.params['built_artifacts']}"
+        elif item.get_closest_marker("slow") or item.get_closest_marker("integration"):
+            group = f"heavy-{heavy % workers}"
+            heavy += 1
+        else:
+            continue
+        item.add_marker(pytest.mark.xdist_group(group))
+
+
+def template_fingerprint(template_root: Path) -> str:
+    """Return a hash of the template files that affect a baked project."""
+    digest = hashlib.sha256()
+    for name in _TEMPLATE_INPUTS:
+        top = template_root / name
+        paths = [top] if top.is_file() else sorted(top.rglob("*"))
+        for path in paths:
+            if not path.is_file() or "__pycache__" in path.parts:
+                continue
+            digest.update(str(path.relative_to(template_root)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _clone_project(source: Path, destination: Path) -> None:
+    """Copy a cached project, hard linking git's immutable object files.
+
+    The virtual environment holds absolute paths and is not cached, it
+    is recreated from the lock file and uv's cache instead when the
+    hooks created one, which is when they locked the project.
+    """
+
+    def link_or_copy(src: str, dst: str) -> None:
+        if f"{os.sep}.git{os.sep}objects{os.sep}" in src:
+            try:
+                os.link(src, dst)
+            except OSError:
+                pass
+            else:
+                return
+        shutil.copy2(src, dst)
+
+    shutil.copytree(source, destination, symlinks=True, copy_function=link_or_copy)
+
+    if (source / "uv.lock").is_file():
+        subprocess.run(
+            ["uv", "sync", "--frozen", "--quiet", "--no-progress"],  # noqa: S607
+            cwd=destination,
+            check=True,
+        )
+
+
+def _prune_bakes(bake_cache_dir: Path) -> None:
+    """Remove cached bakes and their locks unused for BAKE_TTL seconds."""
+    for stale in bake_cache_dir.iterdir():
+        with suppress(OSError):
+            if time.time() - stale.stat().st_mtime > BAKE_TTL:
+                if stale.is_dir():
+                    shutil.rmtree(stale)
+                else:
+                    stale.unlink()
+
+
+@pytest.fixture(scope="session")
+def bake_cache_dir(pytestconfig: pytest.Config) -> Path | None:
+    """Return the directory of cached bakes or None if caching is disabled."""
+    if pytestconfig.getoption("--no-bake-cache"):
+        return None
+    path = pytestconfig.getoption("--bake-cache-dir")
+    if path is None:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        path = Path(base) / _PROJECT / "bakes"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@pytest.fixture(scope="session")
+def bake_project(
+    template_root: Path,
+    bake_cache_dir: Path | None,
+) -> Callable[..., Path]:
+    """Return a function baking projects, reusing previously baked ones.
+
+    Bakes are cached by a hash of the template files, the extra context,
+    the hook setting and the current year. A cached project is cloned
+    into the requested output directory rather than baked again. Bakes
+    are saved without their virtual environment and saving one removes
+    those unused for BAKE_TTL seconds.
+    """
+    fingerprint = template_fingerprint(template_root)
+    uv_version = subprocess.run(
+        ["uv", "--version"],  # noqa: S607
+        capture_output=True,
+        text=True,
+        check=False,
+    ).stdout
+
+    def _bake_project(
+        output_dir: Path,
+        extra_context: dict,
+        *,
+        accept_hooks: bool = True,
+    ) -> Path:
+        """Bake the template with extra_context into output_dir."""
+        if bake_cache_dir is None:
+            return Path(
+                bake(
+                    template=str(template_root),
+                    no_input=True,
+                    extra_context=extra_context,
+                    output_dir=output_dir,
+                    accept_hooks=accept_hooks,
+                )
+            )
+
+        key = hashlib.sha256(
+            json.dumps(
+                [
+                    fingerprint,
+                    extra_context,
+                    accept_hooks,
+                    time.strftime("%Y"),
+                    cookiecutter.__version__,
+                    uv_version,
+                ],
+                sort_keys=True,
+            ).encode()
+        ).hexdigest()
+        entry = bake_cache_dir / key
+
+        # One process, e.g. one xdist worker, bakes a context while
+        # the others wait for it and then clone the cached project.
+        with FileLock(bake_cache_dir / f"{key}.lock"):
+            if not entry.is_dir():
+                staging = bake_cache_dir / f"{key}.tmp"
+                shutil.rmtree(staging, ignore_errors=True)
+                project = bake(
+                    template=str(template_root),
+                    no_input=True,
+                    extra_context=extra_context,
+                    output_dir=staging,
+                    accept_hooks=accept_hooks,
+                )
+                shutil.rmtree(Path(project) / ".venv", ignore_errors=True)
+                staging.rename(entry)
+                _prune_bakes(bake_cache_dir)
+            entry.touch()
+
+        (source,) = entry.iterdir()
+        destination = Path(output_dir) / source.name
+        _clone_project(source, destination)
+        return destination
+
+    return _bake_project
+
+
 @pytest.fixture(scope="session")
 def template_root() -> Path:
     """Return the path for the template under test."""
@@ -153,19 +456,128 @@ def cookiecutter_package_name(cookiecutter_json_contents: dict) -> str:
     return cookiecutter_json_contents["package_name"]
 
 
+@pytest.fixture
+def fake_tools(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> FakeTools:
+    """Return fake uv, uvx, git, gh and direnv, the only programs on PATH."""
+    tools = FakeTools(tmp_path / "fake_tools")
+    monkeypatch.setenv("PATH", tools.path)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("PPC_TRACE_DIR", str(tmp_path / "traces"))
+    monkeypatch.delenv("PPC_BAKE_PID", raising=False)
+    return tools
+
+
+@pytest.fixture
+def hook_loader(
+    tmp_path: Path,
+    template_root: Path,
+    cookiecutter_extra_context: dict,
+) -> Callable[..., ModuleType]:
+    """Return a function loading a hook rendered with extra context."""
+
+    def _hook_loader(name: str, extra_context: dict | None = None) -> ModuleType:
+        context = cookiecutter_extra_context | (extra_context or {})
+        hook = load_hook(template_root, name, context, tmp_path)
+        # loguru levels are global, they exist once any hook was set up
+        with suppress(ValueError):
+            hook._logger_setup()  # noqa: SLF001
+        return hook
+
+    return _hook_loader
+
+
 @pytest.fixture(scope="session")
 def generated_template_path(
     tmp_path_factory: pytest.TempPathFactory,
-    template_root: Path,
-    cookiecutter_package_name: str,
+    bake_project: Callable[..., Path],
     cookiecutter_extra_context: dict,
 ) -> Path:
     """Return a path to the generated project in a temporary directory."""
     tmp_path = tmp_path_factory.mktemp("template_output")
-    bake(
-        template=str(template_root),
-        no_input=True,
-        extra_context=cookiecutter_extra_context,
-        output_dir=tmp_path,
+    return bake_project(tmp_path, cookiecutter_extra_context)
+
+
+@dataclass
+class BuiltArtifacts:
+    """The wheel and sdist built from a generated project."""
+
+    backend: str
+    package_name: str
+    project_path: Path
+    build: subprocess.CompletedProcess
+    wheel: Path
+    sdist: Path
+    wheel_manifest: list[str]
+    sdist_manifest: list[str]
+    metadata: Message
+    entry_points: str
+
+
+@pytest.fixture(scope="session", params=["uv", "hatch"])
+def built_artifacts(
+    request: pytest.FixtureRequest,
+    tmp_path_factory: pytest.TempPathFactory,
+    bake_project: Callable[..., Path],
+    cookiecutter_extra_context: dict,
+) -> BuiltArtifacts:
+    """Return artifacts built once per build backend from a clean project.
+
+    The project is built with its poe build task, the way its release
+    workflow builds it, and named after the backend so the package name
+    is not taken from the template defaults.
+    """
+    backend = request.param
+    package_name = f"build_test_{backend}"
+    tmp_path = tmp_path_factory.mktemp(f"built_{backend}")
+    project_path = bake_project(
+        tmp_path,
+        cookiecutter_extra_context
+        | {"build_backend": backend, "package_name": package_name},
+    )
+
+    for artifacts in ["dist", "build"]:
+        shutil.rmtree(project_path / artifacts, ignore_errors=True)
+
+    build = subprocess.run(
+        ["uv", "run", "poe", "build"],  # noqa: S607
+        cwd=project_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert build.returncode == 0, f"Build with {backend} failed: {build.stderr}"
+
+    dist_dir = project_path / "dist"
+    (wheel,) = dist_dir.glob("*.whl")
+    (sdist,) = dist_dir.glob("*.tar.gz")
+
+    with zipfile.ZipFile(wheel, "r") as archive:
+        wheel_manifest = archive.namelist()
+        dist_info = next(
+            name.rpartition("/")[0]
+            for name in wheel_manifest
+            if name.endswith(".dist-info/METADATA")
+        )
+        metadata = Parser().parsestr(
+            archive.read(f"{dist_info}/METADATA").decode("utf-8")
+        )
+        try:
+            entry_points = archive.read(f"{dist_info}/entry_points.txt").decode()
+        except KeyError:
+            entry_points = ""
+
+    with tarfile.open(sdist, "r:gz") as archive:
+        sdist_manifest = archive.getnames()
+
+    return BuiltArtifacts(
+        backend=backend,
+        package_name=package_name,
+        project_path=project_path,
+        build=build,
+        wheel=wheel,
+        sdist=sdist,
+        wheel_manifest=wheel_manifest,
+        sdist_manifest=sdist_manifest,
+        metadata=metadata,
+        entry_points=entry_points,
     )
-    return tmp_path / cookiecutter_package_name
@@ -0,0 +1,193 @@
+"""Run the template hooks against fake external tools.
+
+The hooks drive uv, uvx, git, gh and direnv through `sh`. FakeTools
+writes small POSIX shell stand-ins for them into a directory that
+replaces PATH, each one records how it was called and answers with
+canned output, an optional delay and an optional failure. Together
+with load_hook, which renders a hook and imports it as a module, the
+hooks' control flow can be exercised quickly and without network.
+"""
+
+import importlib
+import shlex
+import shutil
+import sys
+import types
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cookiecutter.environment import StrictEnvironment
+
+from .render import render_context
+
+TOOLS = ["uv", "uvx", "git", "gh", "direnv"]
+
+# Real programs the fakes delay with and pre_prompt's launcher installs
+# the cached hook runtime with.
+UTILITIES = ["sleep", "mkdir", "cmp", "cp", "mv", "rm"]
+
+# Hooks not rendered by cookiecutter before they are run.
+UNRENDERED_HOOKS = {"pre_prompt"}
+
+
+@dataclass
+class Response:
+    """Canned reply to calls whose arguments match a glob pattern."""
+
+    pattern: str
+    stdout: str = ""
+    stderr: str = ""
+    exit_code: int = 0
+
+
+@dataclass
+class FakeTool:
+    """A recording stand-in for an external program."""
+
+    name: str
+    latency: float = 0.0
+    responses: list[Response] = field(default_factory=list)
+
+    def script(self, log: Path) -> str:
+        """Return the POSIX shell source of this tool."""
+        lines = [
+            "#!/bin/sh",
+            f"printf '%s\\t%s\\n' {self.name} \"$*\" >> {shlex.quote(str(log))}",
+        ]
+        if self.latency:
+            lines.append(f"sleep {self.latency}")
+        lines.append('case "$*" in')
+        for response in self.responses:
+            pattern = "*".join(
+                shlex.quote(part) for part in response.pattern.split("*")
+            )
+            lines.extend(
+                [
+                    f"  {pattern})",
+                    f"    printf '%s' {shlex.quote(response.stdout)}",
+                    f"    printf '%s' {shlex.quote(response.stderr)} >&2",
+                    f"    exit {response.exit_code} ;;",
+                ]
+            )
+        lines.append("esac")
+        return "\n".join(lines) + "\n"
+
+
+class FakeTools:
+    """A PATH directory of fake tools and the log of their calls."""
+
+    def __init__(self, root: Path) -> None:
+        """Write the fake tools to a bin directory in root."""
+        self.bin = root / "bin"
+        self.log = root / "calls.log"
+        self.tools = {name: FakeTool(name) for name in TOOLS}
+        self.bin.mkdir(parents=True, exist_ok=True)
+        self.log.touch()
+        # PATH finds nothing but this directory, link the real utilities.
+        for program in UTILITIES:
+            found = shutil.which(program)
+            if found:
+                (self.bin / program).symlink_to(found)
+        self.install()
+
+    @property
+    def path(self) -> str:
+        """Return a PATH value finding only the fake tools."""
+        return str(self.bin)
+
+    def install(self) -> None:
+        """Write the tool scripts, replacing earlier versions."""
+        for name, tool in self.tools.items():
+            script = self.bin / name
+            script.write_text(tool.script(self.log))
+            script.chmod(0o755)
+
+    def respond(
+        self,
+        name: str,
+        pattern: str = "*",
+        stdout: str = "",
+        *,
+        stderr: str = "",
+        exit_code: int = 0,
+    ) -> None:
+        """Answer calls of tool name with arguments matching pattern.
+
+        Earlier responses take precedence over later ones.
+        """
+        self.tools[name].responses.append(Response(pattern, stdout, stderr, exit_code))
+        self.install()
+
+    def fail(self, name: str, pattern: str = "*", exit_code: int = 1) -> None:
+        """Make calls of tool name with arguments matching pattern fail."""
+        self.respond(
+            name,
+            pattern,
+            stderr=f"fake {name} failed",
+            exit_code=exit_code,
+        )
+
+    def delay(self, name: str, seconds: float) -> None:
+        """Make every call of tool name take at least seconds."""
+        self.tools[name].latency = seconds
+        self.install()
+
+    def remove(self, name: str) -> None:
+        """Make tool name unavailable."""
+        del self.tools[name]
+        (self.bin / name).unlink()
+
+    def calls(self, name: str | None = None) -> list[str]:
+        """Return the arguments of each call, optionally of only tool name."""
+        calls = []
+        for line in self.log.read_text().splitlines():
+            tool, _, args = line.partition("\t")
+            if name is None:
+                calls.append(f"{tool} {args}".strip())
+            elif tool == name:
+                calls.append(args)
+        return calls
+
+
+def load_runtime(template_root: Path) -> types.ModuleType:
+    """Import a fresh hook_runtime, the module every hook imports.
+
+    uv puts the directory of the runtime on sys.path when it runs a
+    hook, here it is the template's hooks directory.
+    """
+    hooks = str(template_root / "hooks")
+    if hooks not in sys.path:
+        sys.path.insert(0, hooks)
+    sys.modules.pop("hook_runtime", None)
+    return importlib.import_module("hook_runtime")
+
+
+def load_hook(
+    template_root: Path,
+    name: str,
+    extra_context: dict,
+    destination: Path,
+) -> types.ModuleType:
+    """Render hook name as cookiecutter would and import it as a module.
+
+    The rendered source is written to destination so tracebacks show
+    the code that ran.
+    """
+    source = (template_root / "hooks" / f"{name}.uv").read_text()
+
+    if name not in UNRENDERED_HOOKS:
+        context = render_context(template_root, extra_context)
+        env = StrictEnvironment(context=context, keep_trailing_newline=True)
+        source = env.from_string(source).render(**context)
+
+    path = destination / f"{name}.py"
+    path.write_text(source)
+
+    load_runtime(template_root)
+
+    module = types.ModuleType(name)
+    module.__file__ = str(path)
+    # dataclasses look up the module of the classes they decorate
+    sys.modules[name] = module
+    exec(compile(source, path, "exec"), module.__dict__)  # noqa: S102
+    return module
@@ -0,0 +1,89 @@
+"""Combinatorial selection of cookiecutter contexts.
+
+Baking every combination of template options grows multiplicatively
+with each option added to cookiecutter.json. A t-wise covering array
+instead picks a small set of contexts in which every combination of
+values of any t options appears at least once, for t=2 (pairwise) the
+number of contexts grows roughly with the log of the number of options.
+"""
+
+from collections.abc import Iterator
+from itertools import combinations, product
+
+# Options that need network access or credentials to bake.
+EXCLUDED_OPTIONS = {"create_github_repo", "make_github_repo_private", "offline"}
+
+Entry = tuple[int, int]
+
+
+def option_space(
+    cookiecutter_json: dict,
+    exclude: set[str] = EXCLUDED_OPTIONS,
+) -> dict[str, list]:
+    """Return the values of each prompted choice and boolean option.
+
+    Private options, those starting with an underscore, and options named
+    in `exclude` are omitted.
+    """
+    space = {}
+    for key, value in cookiecutter_json.items():
+        if key.startswith("_") or key in exclude:
+            continue
+        if isinstance(value, bool):
+            space[key] = [True, False]
+        elif isinstance(value, list):
+            space[key] = value
+    return space
+
+
+def _tuples(row: dict[int, int], strength: int) -> Iterator[tuple[Entry, ...]]:
+    """Yield the strength-sized value combinations found in row."""
+    for combo in combinations(sorted(row), strength):
+        yield tuple((index, row[index]) for index in combo)
+
+
+def covering_array(space: dict[str, list], strength: int = 2) -> list[dict]:
+    """Return contexts covering every combination of `strength` option values.
+
+    Rows are built greedily: each starts from the smallest uncovered
+    combination and the remaining options are given the value covering
+    the most still uncovered combinations. The result is deterministic
+    for a given space.
+    """
+    names = list(space)
+    if strength >= len(names):
+        return full_product(space)
+
+    sizes = [len(space[name]) for name in names]
+    uncovered = {
+        tuple(zip(combo, values, strict=True))
+        for combo in combinations(range(len(names)), strength)
+        for values in product(*(range(sizes[index]) for index in combo))
+    }
+
+    rows = []
+    while uncovered:
+        row = dict(min(uncovered))
+        for index in range(len(names)):
+            if index in row:
+                continue
+
+            def gain(value: int, index: int = index, row: dict = row) -> int:
+                return sum(
+                    tuple(sorted((*others, (index, value)))) in uncovered
+                    for others in _tuples(row, strength - 1)
+                )
+
+            row[index] = max(range(sizes[index]), key=lambda v: (gain(v), -v))
+
+        uncovered.difference_update(_tuples(row, strength))
+        rows.append({names[i]: space[names[i]][v] for i, v in sorted(row.items())})
+
+    return rows
+
+
+def full_product(space: dict[str, list]) -> list[dict]:
+    """Return every combination of option values."""
+    return [
+        dict(zip(space, values, strict=True)) for values in product(*space.values())
+    ]
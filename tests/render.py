@@ -0,0 +1,54 @@
+"""Render the template in memory.
+
+The project tree is rendered with cookiecutter's Jinja environment and
+context handling, but without running hooks or writing files, so the
+output of the template alone can be checked in milliseconds.
+"""
+
+from pathlib import Path
+
+from cookiecutter.environment import StrictEnvironment
+from cookiecutter.generate import generate_context
+from cookiecutter.prompt import prompt_for_config
+from jinja2 import FileSystemLoader
+
+PROJECT_DIR = "{{ cookiecutter.package_name }}"
+
+# Pin values that otherwise change from run to run.
+STABLE_CONTEXT = {"year": "2025"}
+
+
+def render_context(template_root: Path, extra_context: dict) -> dict:
+    """Return the context cookiecutter would render with, without prompting."""
+    context = generate_context(
+        context_file=template_root / "cookiecutter.json",
+        extra_context=STABLE_CONTEXT | extra_context,
+    )
+    context["cookiecutter"] = prompt_for_config(context, no_input=True)
+    # cookiecutter records where the template came from, the output and
+    # repository directories are left out as they vary between runs.
+    context["cookiecutter"]["_template"] = "python-package-cookiecutter"
+    return context
+
+
+def render_template(template_root: Path, extra_context: dict) -> dict[str, str]:
+    """Return the rendered project files keyed by their rendered path.
+
+    As with cookiecutter, files whose name renders empty are not part of
+    the project.
+    """
+    context = render_context(template_root, extra_context)
+    env = StrictEnvironment(context=context, keep_trailing_newline=True)
+    env.loader = FileSystemLoader(str(template_root))
+
+    rendered = {}
+    for path in sorted((template_root / PROJECT_DIR).rglob("*")):
+        if not path.is_file() or "__pycache__" in path.parts:
+            continue
+        relative = path.relative_to(template_root / PROJECT_DIR).as_posix()
+        name = env.from_string(relative).render(**context)
+        if not name or name.endswith("/"):
+            continue
+        template = env.get_template(f"{PROJECT_DIR}/{relative}")
+        rendered[name] = template.render(**context)
+    return rendered
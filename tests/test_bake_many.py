@@ -0,0 +1,116 @@
+"""Test the batch driver generating projects from a manifest."""
+
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from .hook_harness import FakeTools
+from .test_hooks import PYTHON_LIST
+
+
+@pytest.fixture
+def bake_many(template_root: Path) -> ModuleType:
+    """Return the batch driver script imported as a module."""
+    path = template_root / "scripts" / "bake_many.py"
+    spec = importlib.util.spec_from_file_location("bake_many", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_load_manifest_toml(tmp_path: Path, bake_many: ModuleType) -> None:
+    """Test that manifest defaults are merged into every context."""
+    manifest = tmp_path / "manifest.toml"
+    manifest.write_text(
+        "[defaults]\n"
+        'license = "MIT"\n'
+        "[[projects]]\n"
+        'package_name = "alpha"\n'
+        "[[projects]]\n"
+        'package_name = "beta"\n'
+        'license = "Apache-2.0"\n'
+    )
+
+    contexts = bake_many.load_manifest(manifest)
+
+    assert [context["license"] for context in contexts] == ["MIT", "Apache-2.0"]
+    assert all(context["create_github_repo"] is False for context in contexts)
+
+
+def test_load_manifest_json_list(tmp_path: Path, bake_many: ModuleType) -> None:
+    """Test that a JSON manifest may be a bare list of contexts."""
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps([{"package_name": "alpha"}]))
+
+    assert bake_many.load_manifest(manifest) == [
+        {"create_github_repo": False, "package_name": "alpha"}
+    ]
+
+
+@pytest.mark.parametrize(
+    "projects",
+    [[], [{"package_name": "alpha"}, {"package_name": "alpha"}]],
+    ids=["empty", "duplicate"],
+)
+def test_load_manifest_rejects(
+    projects: list[dict],
+    tmp_path: Path,
+    bake_many: ModuleType,
+) -> None:
+    """Test that manifests without projects or with clashing names fail."""
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({"projects": projects}))
+
+    with pytest.raises(ValueError, match="manifest"):
+        bake_many.load_manifest(manifest)
+
+
+def test_shared_setup_runs_once(
+    tmp_path: Path,
+    template_root: Path,
+    fake_tools: FakeTools,
+) -> None:
+    """Test that Python and ruff are prepared once for the whole batch."""
+    fake_tools.respond("uv", "cache dir", str(tmp_path / "uv-cache"))
+    fake_tools.respond("uv", "python list*", PYTHON_LIST)
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "projects": [
+                    {"package_name": "alpha"},
+                    {"package_name": "beta", "python_version_dev": "3.12"},
+                    {"package_name": "gamma", "offline": True},
+                ]
+            }
+        )
+    )
+    output_dir = tmp_path / "projects"
+
+    subprocess.run(
+        [
+            sys.executable,
+            template_root / "scripts" / "bake_many.py",
+            manifest,
+            "--output-dir",
+            output_dir,
+            "--jobs",
+            "2",
+        ],
+        check=True,
+    )
+
+    report = json.loads((output_dir / "bake-report.json").read_text())
+    assert report["uv_cache_dir"] == str(tmp_path / "uv-cache")
+    assert [project["status"] for project in report["projects"]] == ["ok"] * 3
+    for name in ["alpha", "beta", "gamma"]:
+        assert (output_dir / name / "pyproject.toml").exists()
+        assert (output_dir / "bake-logs" / f"{name}.log").exists()
+
+    assert fake_tools.calls("uv").count("python install 3.12 3.13") == 1
+    assert fake_tools.calls("uvx") == ["ruff --version"]
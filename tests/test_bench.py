@@ -0,0 +1,49 @@
+"""Test the benchmark statistics and baseline comparison."""
+
+from pathlib import Path
+
+from .bench import compare, load_baseline, save_baseline, summarize
+
+
+def test_summarize() -> None:
+    """Test the statistics of timing samples."""
+    samples = [3.0, 1.0, 2.0]
+    summary = summarize(samples)
+
+    assert summary["rounds"] == len(samples)
+    assert summary["min"] == min(samples)
+    assert summary["median"] == samples[-1]
+    assert summary["stdev"] == 1.0
+
+
+def test_compare_reports_regressions() -> None:
+    """Test that only slow downs beyond threshold and noise are reported."""
+    baseline = {
+        "steady": summarize([1.0, 1.0, 1.0]),
+        "noisy": summarize([0.5, 1.0, 1.5]),
+        "tiny": summarize([0.001, 0.001]),
+    }
+    current = {
+        "steady": summarize([2.0, 2.0, 2.0]),
+        "noisy": summarize([1.5, 1.5, 1.5]),
+        "tiny": summarize([0.004, 0.004]),
+        "new": summarize([5.0, 5.0]),
+    }
+
+    regressions = compare("default", baseline, current, threshold=0.25)
+
+    assert [regression.metric for regression in regressions] == ["steady"]
+    assert "+100%" in str(regressions[0])
+
+
+def test_baseline_round_trip(tmp_path: Path) -> None:
+    """Test that contexts are added to a stored baseline."""
+    path = tmp_path / "baseline.json"
+    assert load_baseline(path)["contexts"] == {}
+
+    save_baseline(path, "default", {"bake": summarize([1.0])})
+    save_baseline(path, "hatch", {"bake": summarize([2.0])})
+
+    baseline = load_baseline(path)
+    assert set(baseline["contexts"]) == {"default", "hatch"}
+    assert baseline["machine"]["python"]
@@ -0,0 +1,132 @@
+"""Benchmark project generation against a stored baseline.
+
+Each context is baked several times after a warm up round, timing the
+in-memory render, every hook step recorded in the bake's trace, the
+whole bake and the first test run of the generated project. The
+medians are compared with tests/benchmarks/baseline.json. Timings only
+compare on one machine, so the baseline is not committed: record it
+with --bench-update before changing the template, the comparison is
+skipped for contexts without one.
+
+The benchmarks are slow, timing sensitive and only run when asked for,
+without pytest-xdist:
+
+    pytest tests/test_benchmarks.py --bench
+    pytest tests/test_benchmarks.py --bench --bench-update
+"""
+
+import json
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+from cookiecutter.main import cookiecutter as bake
+
+from .bench import compare, load_baseline, save_baseline, summarize
+from .render import render_template
+
+pytestmark = pytest.mark.performance
+
+BASELINE = Path(__file__).parent / "benchmarks" / "baseline.json"
+
+RENDER_ROUNDS = 20
+
+BENCH_CONTEXTS = {
+    "default": {},
+    "hatch": {"build_backend": "hatch"},
+    "no-log-to-file": {"log_to_file": False},
+    # resolves from the uv cache, warmed by an online bake first
+    "offline": {"offline": True},
+}
+
+
+def bake_once(
+    template_root: Path,
+    output_dir: Path,
+    extra_context: dict,
+) -> dict[str, float]:
+    """Bake once and return the timings of the bake in seconds."""
+    trace_dir = output_dir / "traces"
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("PPC_TRACE_DIR", str(trace_dir))
+        start = time.perf_counter()
+        project_path = bake(
+            template=str(template_root),
+            no_input=True,
+            extra_context=extra_context,
+            output_dir=output_dir,
+        )
+        timings = {"bake": time.perf_counter() - start}
+
+    for trace in trace_dir.glob("*.json"):
+        for event in json.loads(trace.read_text())["traceEvents"]:
+            if event["ph"] == "X":
+                timings[f"{event['cat']}:{event['name']}"] = event["dur"] / 1e6
+
+    start = time.perf_counter()
+    subprocess.run(
+        ["uv", "run", "pytest", "-q"],  # noqa: S607
+        cwd=project_path,
+        capture_output=True,
+        check=True,
+    )
+    timings["first_pytest"] = time.perf_counter() - start
+
+    return timings
+
+
+@pytest.mark.parametrize("name", BENCH_CONTEXTS)
+def test_generation_time(
+    name: str,
+    tmp_path_factory: pytest.TempPathFactory,
+    pytestconfig: pytest.Config,
+    template_root: Path,
+    cookiecutter_extra_context: dict,
+) -> None:
+    """Test that generating a project is not slower than the baseline."""
+    if not pytestconfig.getoption("--bench"):
+        pytest.skip("benchmarks run with --bench")
+
+    context = cookiecutter_extra_context | BENCH_CONTEXTS[name]
+    samples: dict[str, list[float]] = {"render": []}
+
+    for _ in range(RENDER_ROUNDS):
+        start = time.perf_counter()
+        render_template(template_root, context)
+        samples["render"].append(time.perf_counter() - start)
+
+    if context.get("offline"):
+        # an offline bake needs its dependencies in the uv cache
+        output_dir = tmp_path_factory.mktemp(f"bench_{name}_warm_cache")
+        bake_once(template_root, output_dir, context | {"offline": False})
+
+    warmup = pytestconfig.getoption("--bench-warmup")
+    rounds = pytestconfig.getoption("--bench-rounds")
+    for round_number in range(warmup + rounds):
+        output_dir = tmp_path_factory.mktemp(f"bench_{name}")
+        timings = bake_once(template_root, output_dir, context)
+        if round_number < warmup:
+            continue
+        for metric, seconds in timings.items():
+            samples.setdefault(metric, []).append(seconds)
+
+    metrics = {metric: summarize(values) for metric, values in samples.items()}
+
+    if pytestconfig.getoption("--bench-update"):
+        save_baseline(BASELINE, name, metrics)
+        return
+
+    baseline = load_baseline(BASELINE)["contexts"].get(name)
+
+    if baseline is None:
+        pytest.skip(f"no baseline for {name}, record one with --bench-update")
+
+    regressions = compare(
+        name,
+        baseline,
+        metrics,
+        pytestconfig.getoption("--bench-threshold"),
+    )
+    assert not regressions, "\n".join(map(str, regressions))
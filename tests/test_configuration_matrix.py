@@ -1,74 +1,59 @@
 """Test different configuration combinations systematically."""
 
 import subprocess
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
-from cookiecutter.main import cookiecutter as bake
 
 from .conftest import check_project_contents
 
+# Text every LICENSE of a license is expected to contain.
+LICENSE_TITLES = {
+    "MIT": "MIT License",
+    "Apache-2.0": "Apache License",
+    "GPL-3.0": "GNU GENERAL PUBLIC LICENSE",
+}
+
 
 class TestConfigurationMatrix:
     """Test various cookiecutter configuration combinations."""
 
     @pytest.mark.parametrize("build_backend", ["uv", "hatch"])
-    @pytest.mark.parametrize("use_pydantic_settings", [True, False])
-    def test_build_backend_combinations(
+    def test_build_backend(
         self,
         tmp_path_factory: pytest.TempPathFactory,
-        template_root: Path,
+        bake_project: Callable[..., Path],
         build_backend: str,
-        use_pydantic_settings: bool,  # noqa: FBT001
     ) -> None:
-        """Test different build backend and settings combinations."""
-        pkg_name = f"build_{build_backend}_{use_pydantic_settings}".lower()
+        """Test that the project builds with each build backend.
+
+        The other options are combined with both backends by
+        test_option_combinations, which does not build.
+        """
+        pkg_name = f"build_{build_backend}"
 
         tmp_path = tmp_path_factory.mktemp(pkg_name)
 
         context = {
             "build_backend": build_backend,
-            "use_pydantic_settings": use_pydantic_settings,
             "create_github_repo": False,
             "package_name": pkg_name,
         }
 
-        # Skip hooks when pydantic settings disabled to avoid ruff issues
-        if not use_pydantic_settings:
-            context["_hooks_ran"] = False
-            project_path = bake(
-                template=str(template_root),
-                no_input=True,
-                extra_context=context,
-                output_dir=tmp_path,
-                accept_hooks=False,
-            )
-        else:
-            project_path = bake(
-                template=str(template_root),
-                no_input=True,
-                extra_context=context,
-                output_dir=tmp_path,
-            )
-
-        project_path = Path(project_path)
+        project_path = Path(bake_project(tmp_path, context))
 
-        # Verify project structure
-        assert check_project_contents(project_path, context["package_name"], context)
-
-        # Test that the project builds with the specified backend (only if hooks ran)
-        if use_pydantic_settings:  # Only test build if hooks ran properly
-            result = subprocess.run(
-                ["uv", "build"],  # noqa: S607
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=60,
-                check=False,
-            )
-            assert result.returncode == 0, (
-                f"Build failed for {build_backend}: {result.stderr}"
-            )
+        result = subprocess.run(
+            ["uv", "build"],  # noqa: S607
+            cwd=project_path,
+            capture_output=True,
+            text=True,
+            timeout=60,
+            check=False,
+        )
+        assert result.returncode == 0, (
+            f"Build failed for {build_backend}: {result.stderr}"
+        )
 
         # Verify pyproject.toml contains correct build system
         pyproject_content = (project_path / "pyproject.toml").read_text()
@@ -77,187 +62,10 @@ class TestConfigurationMatrix:
         else:
             assert "hatchling" in pyproject_content
 
-    @pytest.mark.parametrize(
-        "license_name",
-        ["MIT", "Apache-2.0", "GPL-3.0", "no-license"],
-    )
-    def test_license_variations(
-        self,
-        tmp_path_factory: pytest.TempPathFactory,
-        template_root: Path,
-        license_name: str,
-    ) -> None:
-        """Test different license configurations."""
-        tt = str.maketrans({"-": "_", ".": "_", " ": "_"})
-
-        pkg_name = f"license_test_{license_name.translate(tt)}".lower()
-        tmp_path = tmp_path_factory.mktemp(pkg_name)
-
-        context = {
-            "license": license_name,
-            "create_github_repo": False,
-            "package_name": pkg_name,
-        }
-
-        project_path = bake(
-            template=str(template_root),
-            no_input=True,
-            extra_context=context,
-            output_dir=tmp_path,
-        )
-
-        project_path = Path(project_path)
-
-        # Verify LICENSE file exists and contains expected content
-        license_file = project_path / "LICENSE"
-
-        if license_name == "no-license":
-            assert not license_file.exists(), "no-license: LICENSE should not exist."
-            pytest.skip("No LICENSE file expected for no-license configuration")
-
-        assert license_file.exists(), f"LICENSE file missing for {license}"
-
-        license_content = license_file.read_text()
-
-        # Verify license-specific content
-        match license_name:
-            case "MIT":
-                assert "MIT License" in license_content
-            case "Apache-2.0":
-                assert "Apache License" in license_content
-            case "GPL-3.0":
-                assert "GNU GENERAL PUBLIC LICENSE" in license_content
-
-        # Verify pyproject.toml license field
-        pyproject_content = (project_path / "pyproject.toml").read_text()
-        if license_name != "no-license":
-            assert f'license = "{license_name}"' in pyproject_content
-
-    @pytest.mark.parametrize("log_to_file", [True, False])
-    @pytest.mark.parametrize("use_pydantic_settings", [True, False])
-    def test_feature_combinations(
-        self,
-        tmp_path_factory: pytest.TempPathFactory,
-        template_root: Path,
-        log_to_file: bool,  # noqa: FBT001
-        use_pydantic_settings: bool,  # noqa: FBT001
-    ) -> None:
-        """Test different feature flag combinations."""
-        pkg_name = f"features_{log_to_file!s}_{use_pydantic_settings!s}".lower()
-        tmp_path = tmp_path_factory.mktemp(pkg_name)
-
-        context = {
-            "log_to_file": log_to_file,
-            "use_pydantic_settings": use_pydantic_settings,
-            "create_github_repo": False,
-            "package_name": pkg_name,
-        }
-
-        # Skip hooks to avoid ruff issues when settings are disabled
-        if not use_pydantic_settings:
-            context["_hooks_ran"] = False
-            project_path = bake(
-                template=str(template_root),
-                no_input=True,
-                extra_context=context,
-                output_dir=tmp_path,
-                accept_hooks=False,
-            )
-        else:
-            project_path = bake(
-                template=str(template_root),
-                no_input=True,
-                extra_context=context,
-                output_dir=tmp_path,
-            )
-
-        project_path = Path(project_path)
-
-        # Check main module for feature flags
-        main_module = project_path / "src" / context["package_name"] / "__main__.py"
-        main_content = main_module.read_text()
-
-        # Verify log_to_file configuration
-        if log_to_file:
-            assert "logger.add(" in main_content
-
-        # Verify pydantic-settings configuration
-        if use_pydantic_settings:
-            assert "from .settings import Settings" in main_content
-            settings_file = (
-                project_path / "src" / context["package_name"] / "settings.py"
-            )
-            assert settings_file.exists(), (
-                "settings.py should exist when pydantic-settings is enabled"
-            )
-        else:
-            assert (
-                "from .settings import Settings" not in main_content
-                or "# {%- if" in main_content
-            )
-
-    @pytest.mark.parametrize(
-        "os_matrix",
-        [
-            "ubuntu-latest",
-            "macos-latest",
-            "windows-latest",
-            "ubuntu-latest, macos-latest, windows-latest",
-        ],
-    )
-    @pytest.mark.parametrize(
-        "python_matrix",
-        [
-            "{{ cookiecutter._python_versions[0] }}",
-            "{{ cookiecutter._python_versions[-1] }}",
-            "{{ cookiecutter._python_versions }}",
-        ],
-    )
-    def test_ci_matrix_configurations(
-        self,
-        tmp_path_factory: pytest.TempPathFactory,
-        template_root: Path,
-        os_matrix: str,
-        python_matrix: str,
-    ) -> None:
-        """Test different CI matrix configurations."""
-        tmp_path = tmp_path_factory.mktemp("ci_matrix")
-
-        context = {
-            "os_testing_matrix": os_matrix,
-            "python_testing_matrix": python_matrix,
-            "create_github_repo": False,
-            "package_name": "ci_test",
-        }
-
-        project_path = bake(
-            template=str(template_root),
-            no_input=True,
-            extra_context=context,
-            output_dir=tmp_path,
-        )
-
-        project_path = Path(project_path)
-
-        # Verify GitHub workflow file
-        workflow_file = project_path / ".github" / "workflows" / "release.yaml"
-        assert workflow_file.exists(), "Release workflow should exist"
-
-        workflow_content = workflow_file.read_text()
-
-        # Verify OS matrix
-        for os in os_matrix.split(", "):
-            assert os.strip() in workflow_content, f"OS {os} should be in workflow"
-
-        # Verify Python version matrix (this is more complex due to Jinja rendering)
-        # Just check that the workflow is valid YAML and contains expected structure
-        assert "strategy:" in workflow_content
-        assert "matrix:" in workflow_content
-
     def test_minimal_configuration(
         self,
         tmp_path_factory: pytest.TempPathFactory,
-        template_root: Path,
+        bake_project: Callable[..., Path],
     ) -> None:
         """Test minimal configuration with most features disabled."""
         tmp_path = tmp_path_factory.mktemp("minimal_config")
@@ -271,13 +79,7 @@ class TestConfigurationMatrix:
             "_hooks_ran": False,
         }
 
-        project_path = bake(
-            template=str(template_root),
-            no_input=True,
-            extra_context=context,
-            output_dir=tmp_path,
-            accept_hooks=False,
-        )
+        project_path = bake_project(tmp_path, context, accept_hooks=False)
 
         project_path = Path(project_path)
 
@@ -290,13 +92,13 @@ class TestConfigurationMatrix:
 
         main_content = main_module.read_text()
         # Should still have basic CLI structure
-        assert "typer.Typer()" in main_content
+        assert "LazyTyper()" in main_content
         assert "self_subcommand" in main_content
 
     def test_maximal_configuration(
         self,
         tmp_path_factory: pytest.TempPathFactory,
-        template_root: Path,
+        bake_project: Callable[..., Path],
     ) -> None:
         """Test maximal configuration with all features enabled."""
         tmp_path = tmp_path_factory.mktemp("maximal_config")
@@ -311,12 +113,7 @@ class TestConfigurationMatrix:
             "readme_badges": True,
         }
 
-        project_path = bake(
-            template=str(template_root),
-            no_input=True,
-            extra_context=context,
-            output_dir=tmp_path,
-        )
+        project_path = bake_project(tmp_path, context)
 
         project_path = Path(project_path)
 
@@ -335,3 +132,84 @@ class TestConfigurationMatrix:
         assert result.returncode == 0, (
             f"Tests failed in maximal config: {result.stderr}"
         )
+
+    @pytest.mark.usefixtures("generated_template_path")
+    def test_offline_configuration(
+        self,
+        tmp_path_factory: pytest.TempPathFactory,
+        bake_project: Callable[..., Path],
+    ) -> None:
+        """Test offline generation resolving from a warm uv cache."""
+        tmp_path = tmp_path_factory.mktemp("offline_config")
+
+        context = {
+            "create_github_repo": False,
+            "offline": True,
+            "package_name": "offline_test",
+        }
+
+        # generated_template_path has already populated the uv cache
+        project_path = bake_project(tmp_path, context)
+
+        project_path = Path(project_path)
+
+        assert check_project_contents(project_path, "offline_test", context)
+
+    def test_option_combinations(
+        self,
+        tmp_path_factory: pytest.TempPathFactory,
+        bake_project: Callable[..., Path],
+        matrix_context: dict,
+    ) -> None:
+        """Test combinations of option values chosen by --matrix.
+
+        The default pairwise covering array bakes every value of every
+        option, and every pair of values of any two options, so this
+        covers the license, feature flag and CI matrix variations.
+        """
+        tmp_path = tmp_path_factory.mktemp("option_matrix")
+
+        context = matrix_context | {
+            "create_github_repo": False,
+            "package_name": "matrix_test",
+        }
+
+        # Skip hooks to avoid ruff issues when settings are disabled
+        if not context["use_pydantic_settings"]:
+            context["_hooks_ran"] = False
+            project_path = bake_project(tmp_path, context, accept_hooks=False)
+        else:
+            project_path = bake_project(tmp_path, context)
+
+        project_path = Path(project_path)
+
+        assert check_project_contents(project_path, "matrix_test", context)
+
+        license_file = project_path / "LICENSE"
+        pyproject_content = (project_path / "pyproject.toml").read_text()
+        if context["license"] == "no-license":
+            assert not license_file.exists(), "no-license: LICENSE should not exist."
+        else:
+            assert f'license = "{context["license"]}"' in pyproject_content
+            title = LICENSE_TITLES.get(context["license"], "")
+            assert title in license_file.read_text()
+
+        main_content = (
+            project_path / "src" / "matrix_test" / "__main__.py"
+        ).read_text()
+        settings_import = "from .cached_settings import load_settings"
+        if context["use_pydantic_settings"]:
+            assert settings_import in main_content
+            assert (project_path / "src" / "matrix_test" / "settings.py").exists()
+        else:
+            assert settings_import not in main_content
+        if context["log_to_file"]:
+            assert "add_file_sink(" in main_content
+
+        workflow_content = (
+            project_path / ".github" / "workflows" / "release.yaml"
+        ).read_text()
+        assert "strategy:" in workflow_content
+        assert "matrix:" in workflow_content
+        for os in context["os_testing_matrix"].split(", "):
+            assert os in workflow_content, f"OS {os} should be in workflow"
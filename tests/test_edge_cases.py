@@ -1,32 +1,27 @@
 """Test edge cases and error conditions in generated projects."""
 
 import subprocess
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
-from cookiecutter.main import cookiecutter as bake
 
 from .conftest import check_project_contents
 
 
 def test_no_license_project(
     tmp_path_factory: pytest.TempPathFactory,
-    template_root: Path,
+    bake_project: Callable[..., Path],
     cookiecutter_extra_context: dict,
 ) -> None:
     """Test that projects with no-license still include an Unlicense file."""
     tmp_path = tmp_path_factory.mktemp("no_license_project")
 
-    cookiecutter_extra_context |= {
+    context = cookiecutter_extra_context | {
         "license": "no-license",
     }
 
-    project_path = bake(
-        template=str(template_root),
-        no_input=True,
-        extra_context=cookiecutter_extra_context,
-        output_dir=tmp_path,
-    )
+    project_path = bake_project(tmp_path, context)
 
     # Check that LICENSE file exists and contains Unlicense text
     license_path = Path(project_path) / "LICENSE"
@@ -35,26 +30,19 @@ def test_no_license_project(
 
 def test_no_pydantic_settings_project(
     tmp_path_factory: pytest.TempPathFactory,
-    template_root: Path,
+    bake_project: Callable[..., Path],
     cookiecutter_package_name: str,
     cookiecutter_extra_context: dict,
 ) -> None:
     """Test that projects without pydantic-settings don't include settings.py."""
     tmp_path = tmp_path_factory.mktemp("no_pydantic_project")
 
-    cookiecutter_extra_context |= {
+    context = cookiecutter_extra_context | {
         "use_pydantic_settings": False,
     }
 
     # Generate without hooks to avoid ruff issues in test templates
-    project_path = bake(
-        template=str(template_root),
-        no_input=True,
-        extra_context=cookiecutter_extra_context,
-        output_dir=tmp_path,
-        skip_if_file_exists=True,
-        accept_hooks=False,  # Skip hooks for this test
-    )
+    project_path = bake_project(tmp_path, context, accept_hooks=False)
 
     # Check that settings.py doesn't exist
     settings_path = (
@@ -65,7 +53,7 @@ def test_no_pydantic_settings_project(
     )
 
     # Check project structure (but skip .git and .venv since hooks didn't run)
-    basic_context = cookiecutter_extra_context.copy()
+    basic_context = context.copy()
     basic_context["_hooks_ran"] = False
     assert check_project_contents(
         project_path, cookiecutter_package_name, basic_context
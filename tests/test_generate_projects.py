@@ -1,10 +1,10 @@
 """Generate Projects and Test the Results."""
 
 import json
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
-from cookiecutter.main import cookiecutter as bake
 
 from .conftest import check_project_contents
 
@@ -23,19 +23,14 @@ for key, value in contents.items():
 def test_generate_project(
     extra: dict[str, str],
     tmp_path_factory: pytest.TempPathFactory,
-    template_root: Path,
+    bake_project: Callable[..., Path],
     cookiecutter_extra_context: dict,
     cookiecutter_package_name: str,
 ) -> None:
     """Generate a project using the cookiecutter template and check its contents."""
     tmp_path = tmp_path_factory.mktemp("generated_project")
 
-    project_path = bake(
-        template=str(template_root),
-        no_input=True,
-        extra_context=extra | cookiecutter_extra_context,
-        output_dir=tmp_path,
-    )
+    project_path = bake_project(tmp_path, extra | cookiecutter_extra_context)
 
     context = extra | cookiecutter_extra_context
 
@@ -0,0 +1,396 @@
+"""Test the hooks' control flow against fake external tools."""
+
+import json
+import os
+import shutil
+import subprocess
+import time
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+import sh
+
+from .hook_harness import FakeTools, load_runtime
+
+PYTHON_LIST = json.dumps(
+    [
+        {"version": "3.14.0a1"},
+        {"version": "3.13.5"},
+        {"version": "3.13.4"},
+        {"version": "3.12.11"},
+    ]
+)
+
+
+@pytest.fixture
+def prompt_tools(fake_tools: FakeTools) -> FakeTools:
+    """Return fake tools answering the pre_prompt queries."""
+    fake_tools.respond("uv", "--version", "uv 0.0.0 (fake)")
+    fake_tools.respond("uv", "python list*", PYTHON_LIST)
+    fake_tools.respond("git", "--version", "git version 0.0.0")
+    fake_tools.respond("git", "config --global user.name", "Fake Name")
+    fake_tools.respond("git", "config --global user.email", "fake@example.com")
+    fake_tools.respond("gh", "--version", "gh version 0.0.0")
+    return fake_tools
+
+
+@pytest.fixture
+def cookiecutter_json_copy(tmp_path: Path, cookiecutter_json_path: Path) -> Path:
+    """Return a copy of cookiecutter.json for pre_prompt to update."""
+    return Path(shutil.copy(cookiecutter_json_path, tmp_path / "cookiecutter.json"))
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Return a minimal generated project as the current directory."""
+    project = tmp_path / "project"
+    for subdir in ["src", "tests", "benchmarks"]:
+        (project / subdir).mkdir(parents=True)
+        (project / subdir / "module.py").write_text('"""Module."""\n#\n')
+    monkeypatch.chdir(project)
+    return project
+
+
+def test_hooks_share_one_environment(template_root: Path) -> None:
+    """Test that only the hook runtime declares the script environment."""
+    hooks = template_root / "hooks"
+
+    assert "exclude-newer" in (hooks / "hook_runtime.py").read_text()
+    for path in hooks.glob("*.uv"):
+        head = path.read_text().partition("\n'''\n")[0]
+        assert "# /// script" not in head
+        assert 'exec uv run --quiet --script "$runtime" "$0" "$@"' in head
+
+
+def test_pre_prompt_installs_hook_runtime(
+    fake_tools: FakeTools,
+    template_root: Path,
+    tmp_path: Path,
+) -> None:
+    """Test that pre_prompt caches the hook runtime and runs itself with it."""
+    hooks = shutil.copytree(template_root / "hooks", tmp_path / "template" / "hooks")
+    hook = hooks / "pre_prompt.uv"
+    path = f"{fake_tools.path}{os.pathsep}{os.defpath}"
+
+    subprocess.run(["/bin/sh", hook], env=os.environ | {"PATH": path}, check=True)
+
+    runtime = tmp_path / "cache" / "python-package-cookiecutter" / "hook_runtime.py"
+    assert runtime.read_text() == (hooks / "hook_runtime.py").read_text()
+    assert fake_tools.calls("uv") == [f"run --quiet --script {runtime} {hook}"]
+
+
+def test_post_gen_project_requires_hook_runtime(
+    fake_tools: FakeTools,
+    template_root: Path,
+) -> None:
+    """Test that the later hooks fail when pre_prompt installed no runtime."""
+    hook = template_root / "hooks" / "post_gen_project.uv"
+    path = f"{fake_tools.path}{os.pathsep}{os.defpath}"
+
+    result = subprocess.run(
+        ["/bin/sh", hook],
+        env=os.environ | {"PATH": path},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 1
+    assert "installed by the pre_prompt hook" in result.stderr
+    assert not fake_tools.calls("uv")
+
+
+@pytest.mark.usefixtures("fake_tools")
+def test_hook_runtime_traces_a_bake(
+    template_root: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the bake id reaches the later hooks outside the context."""
+    monkeypatch.setenv("PPC_BAKE_PID", "4242")
+    runtime = load_runtime(template_root)
+    traces = tmp_path / "traces"
+    traces.mkdir()
+    stale = traces / "old-bake.json"
+    stale.write_text("{}")
+    week_ago = time.time() - runtime.TRACE_TTL - 1
+    os.utime(stale, (week_ago, week_ago))
+
+    bake_id = runtime.start_bake()
+    runtime.trace_setup("pre_prompt", bake_id)
+    with runtime.span("step"):
+        pass
+    assert runtime.current_bake() == bake_id
+    runtime.trace_report("pkg")
+
+    trace = json.loads((traces / f"pkg-{bake_id}.json").read_text())
+    assert [event["name"] for event in trace["traceEvents"]] == [
+        "process_name",
+        "step",
+    ]
+    assert sorted(path.name for path in traces.iterdir()) == [f"pkg-{bake_id}.json"]
+
+
+@pytest.mark.usefixtures("prompt_tools")
+def test_pre_prompt_discovers_defaults(
+    hook_loader: Callable[..., ModuleType],
+    cookiecutter_json_copy: Path,
+) -> None:
+    """Test that pre_prompt merges discovered values into cookiecutter.json."""
+    hook = hook_loader("pre_prompt")
+
+    assert hook.pre_prompt(cookiecutter_json_copy) == 0
+
+    result = json.loads(cookiecutter_json_copy.read_text())
+    assert result["github_username"] == "Fake Name"
+    assert result["email"] == "fake@example.com"
+    assert result["_python_versions"] == ["3.12", "3.13"]
+    assert "_bake_id" not in result
+    assert "create_github_repo" in result
+
+
+def test_pre_prompt_caches_python_versions(
+    prompt_tools: FakeTools,
+    hook_loader: Callable[..., ModuleType],
+    cookiecutter_json_copy: Path,
+) -> None:
+    """Test that uv python list is run once for repeated bakes."""
+    hook = hook_loader("pre_prompt")
+
+    for _ in range(3):
+        hook.pre_prompt(cookiecutter_json_copy)
+
+    assert prompt_tools.calls("uv").count("python list --output-format=json") == 1
+
+
+def test_pre_prompt_requires_uv(
+    prompt_tools: FakeTools,
+    hook_loader: Callable[..., ModuleType],
+    cookiecutter_json_copy: Path,
+) -> None:
+    """Test that pre_prompt fails when uv is not available."""
+    prompt_tools.remove("uv")
+    hook = hook_loader("pre_prompt")
+
+    with pytest.raises(sh.CommandNotFound):
+        hook.pre_prompt(cookiecutter_json_copy)
+
+
+def test_pre_prompt_without_gh_disables_github_prompts(
+    prompt_tools: FakeTools,
+    hook_loader: Callable[..., ModuleType],
+    cookiecutter_json_copy: Path,
+) -> None:
+    """Test that GitHub options are removed when gh is not available."""
+    prompt_tools.remove("gh")
+    hook = hook_loader("pre_prompt")
+
+    assert hook.pre_prompt(cookiecutter_json_copy) == 0
+
+    result = json.loads(cookiecutter_json_copy.read_text())
+    assert "create_github_repo" not in result
+    assert "make_github_repo_private" not in result["__prompts__"]
+
+
+@pytest.mark.usefixtures("project_dir")
+def test_post_gen_project_runs_steps(
+    fake_tools: FakeTools,
+    hook_loader: Callable[..., ModuleType],
+) -> None:
+    """Test that post_gen_project runs every step in dependency order."""
+    hook = hook_loader("post_gen_project")
+
+    assert hook.post_gen_project() == 0
+
+    calls = fake_tools.calls()
+    for expected in [
+        "uv python install 3.13",
+        "uv sync --quiet --no-progress",
+        "uvx ruff check --fix src tests benchmarks",
+        "git init --quiet --initial-branch main",
+        "git add .",
+        "git commit -m initial commit",
+        "direnv allow",
+    ]:
+        assert expected in calls
+
+    assert calls.index("git add .") > calls.index("uv sync --quiet --no-progress")
+    assert calls.index("git add .") > calls.index(
+        "uvx ruff check --fix src tests benchmarks"
+    )
+    assert not fake_tools.calls("gh")
+
+
+@pytest.mark.usefixtures("fake_tools")
+def test_post_gen_project_removes_empty_comments(
+    hook_loader: Callable[..., ModuleType],
+    project_dir: Path,
+) -> None:
+    """Test that comment lines left by Jinja directives are removed."""
+    hook_loader("post_gen_project").post_gen_project()
+
+    for subdir in ["src", "tests", "benchmarks"]:
+        module = project_dir / subdir / "module.py"
+        assert module.read_text() == '"""Module."""\n'
+
+
+@pytest.mark.usefixtures("project_dir")
+def test_post_gen_project_required_failure(
+    fake_tools: FakeTools,
+    hook_loader: Callable[..., ModuleType],
+) -> None:
+    """Test that a failed required step stops post_gen_project."""
+    fake_tools.fail("uv", "sync*")
+    hook = hook_loader("post_gen_project")
+
+    with pytest.raises(sh.ErrorReturnCode_1):
+        hook.post_gen_project()
+
+    assert "add ." not in fake_tools.calls("git")
+    assert "commit -m initial commit" not in fake_tools.calls("git")
+
+
+@pytest.mark.usefixtures("project_dir")
+def test_post_gen_project_optional_failure(
+    fake_tools: FakeTools,
+    hook_loader: Callable[..., ModuleType],
+) -> None:
+    """Test that failed optional steps are logged and skipped."""
+    fake_tools.fail("gh")
+    fake_tools.remove("direnv")
+    hook = hook_loader(
+        "post_gen_project",
+        {"create_github_repo": True, "_github_enable_pages": True},
+    )
+
+    assert hook.post_gen_project() == 0
+
+    gh_calls = fake_tools.calls("gh")
+    assert gh_calls[0].startswith("repo create thing --public --push")
+    assert gh_calls[1].startswith("api --silent repos/")
+
+
+@pytest.mark.usefixtures("project_dir")
+def test_post_gen_project_offline(
+    fake_tools: FakeTools,
+    hook_loader: Callable[..., ModuleType],
+) -> None:
+    """Test that offline generation avoids network access."""
+    hook = hook_loader(
+        "post_gen_project",
+        {"offline": True, "create_github_repo": True, "_wheelhouse": "/wheels"},
+    )
+
+    assert hook.post_gen_project() == 0
+
+    uv_calls = fake_tools.calls("uv")
+    assert "python find 3.13" in uv_calls
+    assert (
+        "sync --quiet --no-progress --offline --no-index --find-links=/wheels"
+        in uv_calls
+    )
+    assert "run --offline --no-sync ruff check --fix src tests benchmarks" in uv_calls
+    assert not fake_tools.calls("uvx")
+    assert not fake_tools.calls("gh")
+
+
+@pytest.fixture
+def seeded_project_dir(project_dir: Path, fake_tools: FakeTools) -> Path:
+    """Return a project with dependencies to key seed venvs on."""
+    fake_tools.respond("uv", "--version", "uv 0.0.0 (fake)")
+    (project_dir / "pyproject.toml").write_text(
+        '[project]\nname = "thing"\ndependencies = ["loguru"]\n'
+    )
+    return project_dir
+
+
+def test_post_gen_project_saves_seed_venv(
+    fake_tools: FakeTools,
+    hook_loader: Callable[..., ModuleType],
+    seeded_project_dir: Path,
+    tmp_path: Path,
+) -> None:
+    """Test that a new relocatable venv is saved as the seed venv."""
+    site_packages = seeded_project_dir / ".venv" / "lib" / "site-packages"
+    site_packages.mkdir(parents=True)
+    (site_packages / "loguru.py").touch()
+    hook = hook_loader("post_gen_project")
+
+    assert hook.post_gen_project() == 0
+
+    uv_calls = fake_tools.calls("uv")
+    assert "venv --quiet --relocatable --python 3.13 .venv" in uv_calls
+    assert "sync --quiet --no-progress" in uv_calls
+    assert any(call.startswith("pip uninstall --quiet") for call in uv_calls)
+    seed = tmp_path / "cache" / "python-package-cookiecutter" / "seeds"
+    (saved,) = seed.glob("*/lib/site-packages/*")
+    assert saved.name == "loguru.py"
+    assert saved.stat().st_nlink == 1
+
+
+def test_post_gen_project_replaces_seed_venv(
+    hook_loader: Callable[..., ModuleType],
+    seeded_project_dir: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a refreshed seed venv is renamed over the old one."""
+    site_packages = seeded_project_dir / ".venv" / "lib" / "site-packages"
+    site_packages.mkdir(parents=True)
+    (site_packages / "loguru.py").write_text("new")
+    hook = hook_loader("post_gen_project")
+    seeds = tmp_path / "cache" / "python-package-cookiecutter" / "seeds"
+    old_site_packages = seeds / hook._seed_key() / "lib" / "site-packages"  # noqa: SLF001
+    old_site_packages.mkdir(parents=True)
+    (old_site_packages / "loguru.py").write_text("old")
+    monkeypatch.setenv("PPC_REFRESH_CACHE", "1")
+
+    assert hook.post_gen_project() == 0
+
+    assert (old_site_packages / "loguru.py").read_text() == "new"
+    assert [path.name for path in seeds.iterdir()] == [hook._seed_key()]  # noqa: SLF001
+
+
+def test_post_gen_project_clones_seed_venv(
+    fake_tools: FakeTools,
+    hook_loader: Callable[..., ModuleType],
+    seeded_project_dir: Path,
+    tmp_path: Path,
+) -> None:
+    """Test that a matching seed venv is cloned and synced offline."""
+    hook = hook_loader("post_gen_project")
+    seed = tmp_path / "cache" / "python-package-cookiecutter" / "seeds"
+    site_packages = seed / hook._seed_key() / "lib" / "site-packages"  # noqa: SLF001
+    site_packages.mkdir(parents=True)
+    (site_packages / "loguru.py").write_text("seeded")
+
+    assert hook.post_gen_project() == 0
+
+    uv_calls = fake_tools.calls("uv")
+    assert "sync --quiet --no-progress --offline" in uv_calls
+    assert not any(call.startswith("venv") for call in uv_calls)
+    cloned = seeded_project_dir / ".venv" / "lib" / "site-packages" / "loguru.py"
+    assert cloned.read_text() == "seeded"
+
+
+@pytest.mark.performance
+@pytest.mark.usefixtures("project_dir")
+def test_post_gen_project_steps_overlap(
+    fake_tools: FakeTools,
+    hook_loader: Callable[..., ModuleType],
+) -> None:
+    """Test that independent steps run concurrently."""
+    latency = 0.3
+    for name in ["uv", "uvx", "git"]:
+        fake_tools.delay(name, latency)
+    hook = hook_loader("post_gen_project")
+
+    start = time.perf_counter()
+    hook.post_gen_project()
+    elapsed = time.perf_counter() - start
+
+    # python, sync, git add and git commit are on the critical path,
+    # ruff and git init run alongside python and sync.
+    assert elapsed < 6 * latency
@@ -2,10 +2,10 @@
 
 import os
 import subprocess
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
-from cookiecutter.main import cookiecutter as bake
 
 
 @pytest.mark.integration
@@ -15,7 +15,7 @@ class TestWorkflowIntegration:
     def test_full_development_cycle(
         self,
         tmp_path_factory: pytest.TempPathFactory,
-        template_root: Path,
+        bake_project: Callable[..., Path],
     ) -> None:
         """Test complete development workflow from generation to build."""
         tmp_path = tmp_path_factory.mktemp("full_dev_cycle")
@@ -27,12 +27,7 @@ class TestWorkflowIntegration:
         }
 
         # Generate project
-        project_path = bake(
-            template=str(template_root),
-            no_input=True,
-            extra_context=context,
-            output_dir=tmp_path,
-        )
+        project_path = bake_project(tmp_path, context)
 
         project_path = Path(project_path)
 
@@ -60,7 +55,7 @@ class TestWorkflowIntegration:
     def test_cli_workflow_integration(
         self,
         tmp_path_factory: pytest.TempPathFactory,
-        template_root: Path,
+        bake_project: Callable[..., Path],
     ) -> None:
         """Test CLI functionality integration."""
         tmp_path = tmp_path_factory.mktemp("cli_integration")
@@ -71,12 +66,7 @@ class TestWorkflowIntegration:
             "package_name": "testpackage",
         }
 
-        project_path = bake(
-            template=str(template_root),
-            no_input=True,
-            extra_context=context,
-            output_dir=tmp_path,
-        )
+        project_path = bake_project(tmp_path, context)
 
         # Test CLI installation and usage
         project_path = Path(project_path)
@@ -116,7 +106,7 @@ class TestWorkflowIntegration:
     def test_settings_integration(
         self,
         tmp_path_factory: pytest.TempPathFactory,
-        template_root: Path,
+        bake_project: Callable[..., Path],
     ) -> None:
         """Test pydantic-settings integration works end-to-end."""
         tmp_path = tmp_path_factory.mktemp("settings_integration")
@@ -127,12 +117,7 @@ class TestWorkflowIntegration:
             "package_name": "settingstest",
         }
 
-        project_path = bake(
-            template=str(template_root),
-            no_input=True,
-            extra_context=context,
-            output_dir=tmp_path,
-        )
+        project_path = bake_project(tmp_path, context)
 
         project_path = Path(project_path)
 
@@ -183,7 +168,7 @@ print("Settings integration test passed")
     def test_package_installation_workflow(
         self,
         tmp_path_factory: pytest.TempPathFactory,
-        template_root: Path,
+        bake_project: Callable[..., Path],
     ) -> None:
         """Test that generated packages can be installed and used."""
         tmp_path = tmp_path_factory.mktemp("install_test")
@@ -194,12 +179,7 @@ print("Settings integration test passed")
             "cli_name": "installtest-cli",
         }
 
-        project_path = bake(
-            template=str(template_root),
-            no_input=True,
-            extra_context=context,
-            output_dir=tmp_path,
-        )
+        project_path = bake_project(tmp_path, context)
 
         project_path = Path(project_path)
 
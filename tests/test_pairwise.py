@@ -0,0 +1,51 @@
+"""Test the combinatorial selection of cookiecutter contexts."""
+
+from itertools import combinations
+
+import pytest
+
+from .pairwise import EXCLUDED_OPTIONS, covering_array, full_product, option_space
+
+
+def test_option_space(cookiecutter_json_contents: dict) -> None:
+    """Test that choice and boolean options are found in cookiecutter.json."""
+    space = option_space(cookiecutter_json_contents)
+
+    assert space["build_backend"] == ["uv", "hatch"]
+    assert space["use_pydantic_settings"] == [True, False]
+    assert not EXCLUDED_OPTIONS & space.keys()
+    assert not [key for key in space if key.startswith("_")]
+
+
+@pytest.mark.parametrize("strength", [1, 2, 3])
+def test_covering_array_covers_every_combination(
+    cookiecutter_json_contents: dict,
+    strength: int,
+) -> None:
+    """Test that every combination of option values appears in some context."""
+    space = option_space(cookiecutter_json_contents)
+    contexts = covering_array(space, strength)
+
+    for names in combinations(space, strength):
+        expected = {
+            tuple(context[name] for name in names)
+            for context in full_product({name: space[name] for name in names})
+        }
+        found = {tuple(context[name] for name in names) for context in contexts}
+        assert found == expected, f"Combinations of {names} not covered"
+
+    assert len(contexts) < len(full_product(space))
+
+
+def test_covering_array_is_deterministic(cookiecutter_json_contents: dict) -> None:
+    """Test that the same contexts are chosen every time."""
+    space = option_space(cookiecutter_json_contents)
+
+    assert covering_array(space) == covering_array(space)
+
+
+def test_covering_array_small_space() -> None:
+    """Test that a space with too few options is fully enumerated."""
+    space = {"a": [1, 2], "b": [True, False]}
+
+    assert covering_array(space) == full_product(space)
@@ -1,6 +1,7 @@
 """Test that poe tasks work correctly in generated projects."""
 
 import subprocess
+import zipfile
 from pathlib import Path
 
 import pytest
@@ -21,6 +22,7 @@ def test_poe_tasks_exist(generated_template_path: Path) -> None:
         "check",
         "test",
         "qc",
+        "build",
         "publish_patch",
         "publish_minor",
         "publish_major",
@@ -64,6 +66,26 @@ def test_poe_test_task(generated_template_path: Path) -> None:
     assert "passed" in result.stdout, "Tests should pass in generated project"
 
 
+def test_poe_build_task(generated_template_path: Path) -> None:
+    """Test that the poe build task bakes the version into the wheel."""
+    result = subprocess.run(
+        ["uv", "run", "poe", "build"],  # noqa: S607
+        cwd=generated_template_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, f"poe build failed: {result.stderr}"
+
+    version_file = generated_template_path / "src" / "thing" / "_version.py"
+    assert not version_file.exists(), "_version.py should be removed after build"
+
+    wheel_file = next((generated_template_path / "dist").glob("*.whl"))
+    with zipfile.ZipFile(wheel_file) as wheel:
+        baked = wheel.read("thing/_version.py").decode("utf-8")
+    assert baked == '__version__ = "0.1.0"\n'
+
+
 def test_poe_ruff_tasks(generated_template_path: Path) -> None:
     """Test that ruff tasks work in generated project."""
     for task in ["ruff-check", "ruff-format", "ruff"]:
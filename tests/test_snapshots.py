@@ -0,0 +1,82 @@
+"""Compare the rendered template against golden snapshots.
+
+The template is rendered in memory, without hooks, and each file is
+compared with tests/snapshots/<context>/<path>.snapshot. After an
+intended template change, rewrite the snapshots with:
+
+    pytest tests/test_snapshots.py --update-snapshots
+"""
+
+import difflib
+import shutil
+from pathlib import Path
+
+import pytest
+
+from .render import render_template
+
+SUFFIX = ".snapshot"
+
+SNAPSHOT_CONTEXTS = {
+    "default": {},
+    "hatch": {"build_backend": "hatch"},
+    "minimal": {
+        "use_pydantic_settings": False,
+        "log_to_file": False,
+        "license": "no-license",
+    },
+    "mit-readthedocs": {
+        "license": "MIT",
+        "mkdocs_theme": "readthedocs",
+        "readme_badges": False,
+        "os_testing_matrix": "ubuntu-latest, macos-latest, windows-latest",
+    },
+}
+
+
+def read_snapshot(snapshot_dir: Path) -> dict[str, str]:
+    """Return the snapshot files keyed by the path they were rendered to."""
+    return {
+        path.relative_to(snapshot_dir).as_posix().removesuffix(SUFFIX): path.read_text()
+        for path in sorted(snapshot_dir.rglob(f"*{SUFFIX}"))
+    }
+
+
+def write_snapshot(snapshot_dir: Path, rendered: dict[str, str]) -> None:
+    """Replace the snapshot in snapshot_dir with the rendered files."""
+    shutil.rmtree(snapshot_dir, ignore_errors=True)
+    for name, text in rendered.items():
+        path = snapshot_dir / f"{name}{SUFFIX}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+
+@pytest.mark.parametrize("name", SNAPSHOT_CONTEXTS)
+def test_rendered_template_matches_snapshot(
+    name: str,
+    template_root: Path,
+    pytestconfig: pytest.Config,
+) -> None:
+    """Test that rendering the template produces the golden snapshot."""
+    rendered = render_template(template_root, SNAPSHOT_CONTEXTS[name])
+    snapshot_dir = template_root / "tests" / "snapshots" / name
+
+    if pytestconfig.getoption("--update-snapshots"):
+        write_snapshot(snapshot_dir, rendered)
+
+    expected = read_snapshot(snapshot_dir)
+
+    assert rendered.keys() == expected.keys(), (
+        f"Rendered files differ from snapshot {name}: "
+        f"missing {sorted(expected.keys() - rendered.keys())}, "
+        f"unexpected {sorted(rendered.keys() - expected.keys())}"
+    )
+
+    for path, text in rendered.items():
+        diff = difflib.unified_diff(
+            expected[path].splitlines(keepends=True),
+            text.splitlines(keepends=True),
+            fromfile=f"snapshot/{path}",
+            tofile=f"rendered/{path}",
+        )
+        assert text == expected[path], "".join(diff)
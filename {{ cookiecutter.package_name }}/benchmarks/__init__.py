@@ -0,0 +1,5 @@
+"""{{ cookiecutter.package_name }} benchmarks.
+
+Run them with `poe bench` and compare them with the committed baseline
+with `poe bench-compare`.
+"""
@@ -0,0 +1,8 @@
+"""Run the {{ cookiecutter.package_name }} benchmarks: python -m benchmarks --help"""
+
+import sys
+
+from .harness import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+"""Benchmark the {{ cookiecutter.cli_name }} command-line interface."""
+
+import subprocess
+import sys
+
+from typer.testing import CliRunner
+
+from {{ cookiecutter.package_name }}.__main__ import cli
+
+from .harness import benchmark
+
+runner = CliRunner()
+
+
+@benchmark
+def cli_help() -> None:
+    """Show the main help in this process."""
+    runner.invoke(cli, ["--help"])
+
+
+@benchmark
+def cli_startup() -> None:
+    """Start the CLI in a new interpreter and show the main help."""
+    subprocess.run(
+        [sys.executable, "-m", "{{ cookiecutter.package_name }}", "--help"],
+        capture_output=True,
+        check=True,
+    )
@@ -0,0 +1,181 @@
+"""A small benchmark harness using only the standard library.
+
+Benchmarks are functions without arguments registered with the
+`benchmark` decorator in `bench_*.py` modules of this package. Each
+benchmark is called a few times to warm up, the number of calls per
+round is calibrated so a round lasts at least `min_time` seconds and
+then several rounds are timed. Timings are reported in seconds per
+call and can be written to a JSON file and compared with a baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import importlib
+import json
+import pkgutil
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+BENCHMARKS: dict[str, Callable[[], object]] = {}
+
+
+def benchmark(func: Callable[[], object]) -> Callable[[], object]:
+    """Register func as a benchmark named after it."""
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+@dataclass
+class Result:
+    """Timings of a benchmark in seconds per call."""
+
+    name: str
+    calls: int
+    rounds: int
+    min: float
+    median: float
+    mean: float
+    stdev: float
+
+
+def calibrate(func: Callable[[], object], min_time: float) -> int:
+    """Return the number of calls of func taking at least min_time seconds."""
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        if time.perf_counter() - start >= min_time:
+            return calls
+        calls *= 2
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    *,
+    warmup: int = 3,
+    rounds: int = 5,
+    min_time: float = 0.1,
+) -> Result:
+    """Time rounds of calls of func after warmup calls."""
+    for _ in range(warmup):
+        func()
+
+    calls = calibrate(func, min_time)
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        samples.append((time.perf_counter() - start) / calls)
+
+    return Result(
+        name=name,
+        calls=calls,
+        rounds=rounds,
+        min=min(samples),
+        median=statistics.median(samples),
+        mean=statistics.fmean(samples),
+        stdev=statistics.stdev(samples) if rounds > 1 else 0.0,
+    )
+
+
+def discover() -> None:
+    """Import the bench_*.py modules of this package, registering benchmarks."""
+    package = __name__.rpartition(".")[0]
+    for module in pkgutil.iter_modules([str(Path(__file__).parent)]):
+        if module.name.startswith("bench_"):
+            importlib.import_module(f"{package}.{module.name}")
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """Return the benchmarks whose median is slower than baseline by threshold.
+
+    Benchmarks missing from the baseline are not compared.
+    """
+    regressions = []
+    for name, now in current["benchmarks"].items():
+        then = baseline["benchmarks"].get(name)
+        if then is None:
+            continue
+        change = now["median"] / then["median"] - 1
+        if change > threshold:
+            regressions.append(
+                f"{name}: {then['median']:.6f}s -> {now['median']:.6f}s ({change:+.1%})"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks, optionally saving and comparing the results."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", "--filter", default="*", help="glob of names to run")
+    parser.add_argument("--warmup", type=int, default=3, help="warm up calls")
+    parser.add_argument("--rounds", type=int, default=5, help="timed rounds")
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.1,
+        help="minimum seconds per round",
+    )
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="fail when a median is this much slower than the baseline",
+    )
+    args = parser.parse_args(argv)
+
+    if args.compare and not args.compare.exists():
+        parser.error(
+            f"no baseline at {args.compare}, record one with --output {args.compare}"
+        )
+
+    discover()
+    results = {}
+    print(f"{'benchmark':<24} {'calls':>7} {'min':>12} {'median':>12} {'stdev':>12}")
+    for name, func in sorted(BENCHMARKS.items()):
+        if not fnmatch.fnmatch(name, args.filter):
+            continue
+        result = measure(
+            name,
+            func,
+            warmup=args.warmup,
+            rounds=args.rounds,
+            min_time=args.min_time,
+        )
+        print(
+            f"{name:<24} {result.calls:>7} {result.min:>11.6f}s "
+            f"{result.median:>11.6f}s {result.stdev:>11.6f}s"
+        )
+        results[name] = asdict(result)
+
+    current = {
+        "machine": {
+            "system": platform.system(),
+            "machine": platform.machine(),
+            "python": platform.python_version(),
+        },
+        "benchmarks": results,
+    }
+
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2) + "\n")
+
+    if not args.compare:
+        return 0
+
+    baseline = json.loads(args.compare.read_text())
+    regressions = compare(baseline, current, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
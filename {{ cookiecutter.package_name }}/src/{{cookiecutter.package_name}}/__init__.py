@@ -5,4 +5,22 @@
 
 from loguru import logger
 
+try:
+    from ._version import __version__  # ty: ignore[unresolved-import]
+except ImportError:
+    # _version.py is written when the package is built, editable installs
+    # are not built so the version is looked up in the package metadata.
+
+    def __getattr__(name: str) -> str:
+        """Return the package version from the package metadata."""
+        if name == "__version__":
+            from importlib.metadata import version  # noqa: PLC0415
+
+            return version("{{ cookiecutter.package_name }}")
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+
+__all__ = ["__version__"]
+
 logger.disable("{{ cookiecutter.package_name }}")
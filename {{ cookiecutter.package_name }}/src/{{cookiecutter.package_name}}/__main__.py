@@ -4,45 +4,133 @@
 """
 
 import sys
+from pathlib import Path
+from typing import Optional
 
 import typer
 from loguru import logger
 
-from .self_subcommand import cli as self_cli
+from .lazy_typer import LazyTyper
 
-# {%- if cookiecutter.use_pydantic_settings %}
-from .settings import Settings
-# {%- endif %}
+cli = LazyTyper()
 
-cli = typer.Typer()
-
-cli.add_typer(
-    self_cli,
+cli.add_lazy_typer(
+    "{{ cookiecutter.package_name }}.self_subcommand:cli",
     name="self",
     help="Manage the {{ cookiecutter.cli_name }} command.",
 )
 
 
 @cli.callback(invoke_without_command=True, no_args_is_help=True)
-def global_callback(
-    ctx: typer.Context,  # noqa: ARG001
+def global_callback(  # noqa: PLR0913, PLR0917
+    ctx: typer.Context,
     debug: bool = typer.Option(
         False,
         "--debug",
         "-D",
         help="Enable debugging output.",
     ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Profile the command with cProfile.",
+    ),
+    profile_sample: bool = typer.Option(
+        False,
+        "--profile-sample",
+        help="Profile the command by sampling its stack, Unix only.",
+    ),
+    memprofile: bool = typer.Option(
+        False,
+        "--memprofile",
+        help="Report the memory allocations of the command.",
+    ),
+    profile_output: Optional[Path] = typer.Option(  # noqa: B008, FA100
+        None,
+        "--profile-output",
+        metavar="PATH",
+        help="Write the profile or memory snapshot to PATH.",
+    ),
+    profile_rate: Optional[int] = typer.Option(  # noqa: FA100
+        None,
+        "--profile-rate",
+        min=1,
+        metavar="HZ",
+        help="Stack samples per CPU second, defaults to 100.",
+    ),
 ) -> None:
     """{{ cookiecutter.project_short_description }}"""
+    if sum((profile, profile_sample, memprofile)) > 1:
+        msg = "Choose one of --profile, --profile-sample and --memprofile."
+        raise typer.BadParameter(msg)
     # {%- if cookiecutter.use_pydantic_settings %}
-    ctx.obj = Settings()
+    from .cached_settings import load_settings  # noqa: PLC0415
+
+    ctx.obj = load_settings()
     debug = debug or ctx.obj.debug
+    # a profiler chosen on the command line replaces the configured one
+    if not (profile or profile_sample or memprofile):
+        profile = ctx.obj.profile
+        profile_sample = ctx.obj.profile_sample
+        memprofile = ctx.obj.memprofile
+        if sum((profile, profile_sample, memprofile)) > 1:
+            msg = "Set one of the profile, profile_sample and memprofile settings."
+            raise typer.BadParameter(msg)
+    profile_output = profile_output or ctx.obj.profile_output or None
+    profile_rate = profile_rate or ctx.obj.profile_rate
     # {%- endif %}
     (logger.enable if debug else logger.disable)("{{ cookiecutter.package_name }}")
     # {%- if cookiecutter.log_to_file %}
-    logger.add("{{ cookiecutter.package_name }}.log")
+    from .log_sinks import add_file_sink  # noqa: PLC0415
+
+    # {%- if cookiecutter.use_pydantic_settings %}
+    add_file_sink(
+        ctx.obj.log_file,
+        rotation=ctx.obj.log_rotation or None,
+        retention=ctx.obj.log_retention or None,
+        compression=ctx.obj.log_compression or None,
+    )
+    # {%- else %}
+    add_file_sink("{{ cookiecutter.package_name }}.log")
+    # {%- endif %}
     # {%- endif %}
     logger.info(f"{debug=}")
+    # {%- if cookiecutter.use_pydantic_settings %}
+    if ctx.obj.instrument:
+        from . import instrument  # noqa: PLC0415
+
+        instrument.enable(ctx.obj.instrument)
+        ctx.call_on_close(instrument.disable)
+    # {%- endif %}
+    if profile or profile_sample or memprofile:
+        from .profiling import (  # noqa: PLC0415
+            start_cprofile,
+            start_memprofile,
+            start_sampler,
+        )
+
+        # {%- if cookiecutter.use_pydantic_settings %}
+        top = ctx.obj.profile_top
+        # {%- else %}
+        top = None
+        # {%- endif %}
+        if profile_sample:
+            try:
+                stop = start_sampler(
+                    profile_output,
+                    rate=profile_rate,
+                    top=top,
+                    report=debug,
+                )
+            except NotImplementedError as error:
+                raise typer.BadParameter(
+                    str(error), param_hint="--profile-sample"
+                ) from error
+        elif memprofile:
+            stop = start_memprofile(profile_output, top=top)
+        else:
+            stop = start_cprofile(profile_output, top=top, report=debug)
+        ctx.call_on_close(stop)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,220 @@
+"""{{ cookiecutter.package_name }} hot path instrumentation.
+
+Wrap a block of code or a function in a named span to time it:
+
+    from {{ cookiecutter.package_name }}.instrument import span
+
+    with span("parse"):
+        ...
+
+    @span("load")
+    def load() -> None: ...
+
+Spans cost a flag check until instrumentation is enabled by calling
+`enable`, with the `instrument` setting or by setting
+
+    {{ cookiecutter.package_name.upper() }}INSTRUMENT=log|path/to/trace.json
+
+before this module is imported, the variable the `instrument` setting
+reads. Enabled spans are timed with a
+monotonic clock and aggregated per name. When instrumentation is
+disabled, or the interpreter exits, the count, total and maximum of
+every span are logged through the package logger (shown with --debug)
+or every span is written to a Chrome trace JSON file, which
+chrome://tracing, Perfetto and speedscope open.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, TypeVar, cast
+
+from loguru import logger
+
+# {%- if cookiecutter.use_pydantic_settings %}
+from .cached_settings import ENV_PREFIX
+# {%- else %}
+ENV_PREFIX = "{{ cookiecutter.package_name.upper() }}"
+# {%- endif %}
+
+ENV_VAR = f"{ENV_PREFIX}INSTRUMENT"
+LOG = "log"
+MAX_EVENTS = 1_000_000
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Recorder:
+    """Span timings collected while instrumentation is enabled."""
+
+    def __init__(self, output: str) -> None:
+        """Collect span timings for output, LOG or a trace file path."""
+        self.output = output
+        self.origin = time.perf_counter_ns()
+        self.stats: dict[str, list[int]] = {}
+        self.events: list[tuple[str, int, int, int]] | None = (
+            None if output == LOG else []
+        )
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def record(self, name: str, start: int, end: int) -> None:
+        """Add a span of name from start to end, in perf_counter_ns."""
+        elapsed = end - start
+        with self._lock:
+            stat = self.stats.get(name)
+            if stat is None:
+                self.stats[name] = [1, elapsed, elapsed]
+            else:
+                stat[0] += 1
+                stat[1] += elapsed
+                stat[2] = max(stat[2], elapsed)
+            if self.events is None:
+                return
+            if len(self.events) < MAX_EVENTS:
+                self.events.append((name, start, elapsed, threading.get_ident()))
+            else:
+                self.dropped += 1
+
+    def emit(self) -> None:
+        """Log the span summary or write the Chrome trace file."""
+        if self.events is None:
+            for name, (count, total, longest) in sorted(
+                self.stats.items(), key=lambda item: item[1][1], reverse=True
+            ):
+                logger.info(
+                    f"span {name}: count={count} total={total / 1e6:.3f}ms "
+                    f"mean={total / count / 1e6:.3f}ms max={longest / 1e6:.3f}ms"
+                )
+            return
+
+        pid = os.getpid()
+        trace = {
+            "traceEvents": [
+                {
+                    "name": name,
+                    "cat": "span",
+                    "ph": "X",
+                    "ts": (start - self.origin) / 1000,
+                    "dur": elapsed / 1000,
+                    "pid": pid,
+                    "tid": tid,
+                }
+                for name, start, elapsed, tid in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+        Path(self.output).write_text(json.dumps(trace))
+        logger.info(f"{len(self.events)} spans written to {self.output}")
+        if self.dropped:
+            logger.warning(f"{self.dropped} spans beyond {MAX_EVENTS} were dropped")
+
+
+_recorder: Recorder | None = None
+
+
+class Span:
+    """A named span, used as a context manager or a function decorator."""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str | None = None) -> None:
+        """Name the span, decorated functions default to their qualname."""
+        self.name = name
+        self.start: int | None = None
+
+    def __enter__(self) -> Span:  # noqa: PYI034
+        """Start timing when instrumentation is enabled."""
+        if _recorder is not None:
+            self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Record the span started by __enter__."""
+        if self.start is not None and _recorder is not None:
+            _recorder.record(self.name or "span", self.start, time.perf_counter_ns())
+        self.start = None
+
+    def __call__(self, func: F) -> F:
+        """Return func timed as this span on every call."""
+        name = self.name or getattr(func, "__qualname__", repr(func))
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            recorder = _recorder
+            if recorder is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                recorder.record(name, start, time.perf_counter_ns())
+
+        return cast("F", wrapper)
+
+
+class _DisabledSpan(Span):
+    """A span entered while instrumentation is disabled, timing nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> Span:
+        """Do nothing."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Do nothing."""
+
+
+@functools.lru_cache(maxsize=1024)
+def _disabled_span(name: str | None) -> _DisabledSpan:
+    """Return the shared disabled span of name."""
+    return _DisabledSpan(name)
+
+
+def span(name: str | None = None) -> Span:
+    """Return a span timing a with block or every call of a function.
+
+    While instrumentation is disabled a shared span of name is returned
+    whose with block does nothing, functions it decorates are still
+    timed once instrumentation is enabled.
+    """
+    if _recorder is None:
+        return _disabled_span(name)
+    return Span(name)
+
+
+def enabled() -> bool:
+    """Return True when spans are being recorded."""
+    return _recorder is not None
+
+
+def enable(output: str = LOG) -> None:
+    """Start recording spans, reported to output when disabled.
+
+    Output is LOG to log a summary or the path of a Chrome trace JSON
+    file. Spans recorded so far are reported first.
+    """
+    global _recorder  # noqa: PLW0603
+    disable()
+    _recorder = Recorder(output)
+
+
+def disable() -> None:
+    """Stop recording spans and report the spans recorded."""
+    global _recorder
+    recorder, _recorder = _recorder, None
+    if recorder is not None:
+        recorder.emit()
+
+
+atexit.register(disable)
+
+if os.environ.get(ENV_VAR):
+    enable(os.environ[ENV_VAR])
@@ -0,0 +1,95 @@
+"""{{ cookiecutter.cli_name }} lazily loaded subcommands.
+
+Subcommand applications are registered by dotted import path and are
+only imported when they are dispatched. Help text is supplied at
+registration time so `{{ cookiecutter.cli_name }} --help` can list every
+subcommand without importing any of them.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, ClassVar
+
+import typer
+from typer.core import TyperGroup
+
+
+class LazySubcommand(TyperGroup):
+    """Stand-in for a sub-application that is imported on first use."""
+
+    def __init__(self, import_path: str, name: str, help: str) -> None:  # noqa: A002
+        """Declare a sub-application found at `import_path`.
+
+        The path is of the form `package.module:attribute` where
+        attribute names a `typer.Typer` instance.
+        """
+        super().__init__(name=name, help=help)
+        self.import_path = import_path
+        self._command: TyperGroup | None = None
+
+    def load(self) -> TyperGroup:
+        """Import the sub-application and return its click group."""
+        if self._command is None:
+            module_name, _, attribute = self.import_path.partition(":")
+            app = getattr(importlib.import_module(module_name), attribute)
+            command = typer.main.get_group(app)
+            command.help = command.help or self.help
+            self._command = command
+        return self._command
+
+    def make_context(
+        self,
+        info_name: str | None,
+        args: list[str],
+        parent: Any = None,  # noqa: ANN401
+        **extra: Any,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        """Hand parsing and dispatch to the real sub-application."""
+        return self.load().make_context(info_name, args, parent=parent, **extra)
+
+
+class LazyTyperGroup(TyperGroup):
+    """A TyperGroup that also lists lazily loaded subcommands."""
+
+    lazy_subcommands: ClassVar[dict[str, LazySubcommand]] = {}
+
+    def list_commands(self, ctx: Any) -> list[str]:  # noqa: ANN401
+        """Return eager and lazy subcommand names in registration order."""
+        names = super().list_commands(ctx)
+        return names + [name for name in self.lazy_subcommands if name not in names]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:  # noqa: ANN401
+        """Return the named subcommand, preferring eagerly registered ones."""
+        command = super().get_command(ctx, cmd_name)
+        return command or self.lazy_subcommands.get(cmd_name)
+
+
+class LazyTyper(typer.Typer):
+    """A Typer application supporting lazily imported sub-applications."""
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Create the application, see `typer.Typer` for arguments."""
+        self.lazy_subcommands: dict[str, LazySubcommand] = {}
+        base = kwargs.pop("cls", None) or LazyTyperGroup
+        kwargs["cls"] = type(
+            base.__name__,
+            (base,),
+            {"lazy_subcommands": self.lazy_subcommands},
+        )
+        super().__init__(**kwargs)
+
+    def add_lazy_typer(
+        self,
+        import_path: str,
+        *,
+        name: str,
+        help: str,  # noqa: A002
+    ) -> None:
+        """Register the sub-application at `import_path` as `name`.
+
+        This is the lazy counterpart of `typer.Typer.add_typer`, the
+        module named in `import_path` is not imported until the
+        subcommand is dispatched.
+        """
+        self.lazy_subcommands[name] = LazySubcommand(import_path, name, help)
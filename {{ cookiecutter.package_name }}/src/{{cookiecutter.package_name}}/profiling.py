@@ -0,0 +1,196 @@
+"""{{ cookiecutter.cli_name }} command profiling.
+
+A profiler is started by `global_callback` before the command is
+dispatched and stopped when the command's context is closed, so the
+profile covers the command and nothing of the interpreter start up
+(see `{{ cookiecutter.cli_name }} self startup-profile` for that).
+
+`start_cprofile` records every call, which is exact but can slow tight
+loops down several times. `start_sampler` records the stack at a fixed
+rate of CPU time instead, cheap enough to leave on in production.
+`start_memprofile` traces memory allocations with tracemalloc.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import signal
+import sys
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from types import CodeType, FrameType
+
+PROFILE_OUTPUT = "{{ cookiecutter.package_name }}.pstats"
+PROFILE_TOP = 20
+SAMPLE_OUTPUT = "{{ cookiecutter.package_name }}.folded"
+SAMPLE_RATE = 100
+
+
+def start_cprofile(
+    path: str | Path | None = None,
+    *,
+    top: int | None = None,
+    report: bool = False,
+) -> Callable[[], None]:
+    """Start profiling with cProfile and return a function stopping it.
+
+    The stop function writes the statistics to path, which can be read
+    with `python -m pstats` or a viewer such as snakeviz, and when
+    report is true prints the top functions by cumulative time to
+    stderr.
+    """
+    path = Path(path or PROFILE_OUTPUT)
+    profiler = cProfile.Profile()
+
+    def stop() -> None:
+        profiler.disable()
+        profiler.dump_stats(path)
+        logger.info(f"Profile written to {path}")
+        if report:
+            stats = pstats.Stats(profiler, stream=sys.stderr)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE)
+            stats.print_stats(top or PROFILE_TOP)
+
+    profiler.enable()
+    return stop
+
+
+def start_sampler(
+    path: str | Path | None = None,
+    *,
+    rate: int | None = None,
+    top: int | None = None,
+    report: bool = False,
+) -> Callable[[], None]:
+    """Start sampling the stack rate times a CPU second, return a stopper.
+
+    A profiling interval timer interrupts the process and the stack of
+    the interrupted frame is counted. The stop function writes the
+    counts to path as folded stacks, one `outer;...;inner count` line
+    per stack, which flamegraph.pl and speedscope read. When report is
+    true the functions sampled most often are printed to stderr.
+
+    Signal handlers only run in the main thread, so other threads are
+    not sampled. Raises NotImplementedError where signal.setitimer is
+    missing, like on Windows.
+    """
+    if not hasattr(signal, "setitimer"):
+        msg = "sampling needs signal.setitimer, which this platform lacks"
+        raise NotImplementedError(msg)
+
+    path = Path(path or SAMPLE_OUTPUT)
+    interval = 1 / (rate or SAMPLE_RATE)
+    names: dict[CodeType, str] = {}
+    stacks: Counter[tuple[str, ...]] = Counter()
+
+    def sample(_signum: int, frame: FrameType | None) -> None:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            name = names.get(code)
+            if name is None:
+                module = frame.f_globals.get("__name__", code.co_filename)
+                function = getattr(code, "co_qualname", code.co_name)
+                name = names[code] = f"{module}:{function}".replace(" ", "_")
+            stack.append(name)
+            frame = frame.f_back
+        stacks[tuple(reversed(stack))] += 1
+
+    def stop() -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, previous)
+        with path.open("w") as stream:
+            for stack, count in stacks.items():
+                stream.write(f"{';'.join(stack)} {count}\n")
+        total = sum(stacks.values())
+        logger.info(f"{total} samples written to {path}")
+        if report:
+            leaves: Counter[str] = Counter()
+            for stack, count in stacks.items():
+                leaves[stack[-1]] += count
+            sys.stderr.write(f"{'samples':>8} {'%':>6}  function\n")
+            for name, count in leaves.most_common(top or PROFILE_TOP):
+                sys.stderr.write(f"{count:>8} {count / total:>6.1%}  {name}\n")
+
+    previous = signal.signal(signal.SIGPROF, sample)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    return stop
+
+
+def _peak_rss() -> int | None:
+    """Return the peak resident set size of this process in bytes."""
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:
+        # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    """Return a snapshot of traced allocations made outside tracemalloc."""
+    return tracemalloc.take_snapshot().filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ]
+    )
+
+
+def start_memprofile(
+    path: str | Path | None = None,
+    *,
+    top: int | None = None,
+) -> Callable[[], None]:
+    """Start tracing memory allocations and return a function stopping it.
+
+    The stop function prints to stderr the peak RSS of the process, the
+    peak of traced memory and the top allocation sites by size, by
+    count and by growth since the start. When path is given the last
+    snapshot is dumped there to be loaded with
+    `tracemalloc.Snapshot.load`.
+
+    Tracing already started, by PYTHONTRACEMALLOC for example, is left
+    running.
+    """
+    top = top or PROFILE_TOP
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = _snapshot()
+
+    def stop() -> None:
+        end = _snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        if not tracing:
+            tracemalloc.stop()
+        if path:
+            end.dump(str(path))
+            logger.info(f"Memory snapshot written to {path}")
+
+        rss = _peak_rss()
+        lines = [
+            f"peak RSS {rss / 2**20:.1f} MiB" if rss else "peak RSS unknown",
+            f"peak traced {peak / 2**20:.1f} MiB",
+            f"top {top} allocation sites by size:",
+        ]
+        statistics = end.statistics("lineno")
+        lines.extend(f"  {stat}" for stat in statistics[:top])
+        lines.append(f"top {top} allocation sites by count:")
+        by_count = sorted(statistics, key=lambda stat: stat.count, reverse=True)
+        lines.extend(f"  {stat}" for stat in by_count[:top])
+        lines.append(f"top {top} allocation sites by growth:")
+        lines.extend(f"  {stat}" for stat in end.compare_to(start, "lineno")[:top])
+        sys.stderr.write("\n".join(lines) + "\n")
+
+    return stop
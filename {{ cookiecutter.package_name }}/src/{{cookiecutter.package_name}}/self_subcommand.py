@@ -4,7 +4,16 @@ This module provides a command-line interface to interact with
 internals of the {{ cookiecutter.cli_name }} CLI.
 """
 
-from importlib.metadata import version
+from __future__ import annotations
+
+import math
+import statistics
+import subprocess
+import sys
+import time
+import typing
+from dataclasses import dataclass, field
+from typing import Optional
 
 import typer
 from loguru import logger
@@ -16,9 +25,123 @@ cli = typer.Typer()
 def version_subcommand() -> None:
     """Retrieve the package version."""
     try:
-        pkg_version = version("{{ cookiecutter.package_name }}")
+        from . import __version__ as pkg_version  # noqa: PLC0415
+
         logger.info(f"Package version: {pkg_version}")
         typer.secho(pkg_version, fg=typer.colors.GREEN)
     except Exception as error:
         logger.error(f"Failed to retrieve package version: {error}")
         raise typer.Exit(code=1) from None
+
+
+@dataclass
+class ImportRecord:
+    """Import cost of a single module reported by `python -X importtime`."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    children: list[ImportRecord] = field(default_factory=list)
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """Return the import tree described by `-X importtime` output.
+
+    CPython reports a module after all of the modules it imported,
+    indenting nested imports by two spaces per level.
+    """
+    pending: dict[int, list[ImportRecord]] = {}
+
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:") :].split("|")
+            record = ImportRecord(name.strip(), int(self_us), int(cumulative_us))
+        except ValueError:
+            # the column header line
+            continue
+        depth = len(name) - len(name.lstrip())
+        record.children = pending.pop(depth + 2, [])
+        pending.setdefault(depth, []).append(record)
+
+    return pending[min(pending)] if pending else []
+
+
+def _print_import_tree(
+    records: list[ImportRecord],
+    threshold_us: int,
+    depth: int = 0,
+) -> None:
+    """Print records and their children sorted by cumulative cost."""
+    for record in sorted(records, key=lambda r: r.cumulative_us, reverse=True):
+        if record.cumulative_us < threshold_us:
+            continue
+        typer.echo(
+            f"{record.cumulative_us / 1000:10.1f} {record.self_us / 1000:10.1f}  "
+            f"{'  ' * depth}{record.name}"
+        )
+        _print_import_tree(record.children, threshold_us, depth + 1)
+
+
+@cli.command(
+    name="startup-profile",
+    context_settings={"allow_extra_args": True, "ignore_unknown_options": True},
+)
+def startup_profile_subcommand(
+    # typer evaluates the annotation at runtime, keep it valid on every Python
+    args: Optional[typing.List[str]] = typer.Argument(  # noqa: B008, UP006, UP045
+        None,
+        help="Arguments to profile, defaults to --help.",
+    ),
+    runs: int = typer.Option(
+        10,
+        "--runs",
+        "-n",
+        min=1,
+        help="Number of cold runs used to measure wall time.",
+    ),
+    threshold: float = typer.Option(
+        1.0,
+        "--threshold",
+        "-t",
+        min=0.0,
+        help="Hide modules with a cumulative import time below this (ms).",
+    ),
+) -> None:
+    """Profile the start up cost of {{ cookiecutter.cli_name }}."""
+    command = [sys.executable, "-m", "{{ cookiecutter.package_name }}"]
+    command.extend(args or ["--help"])
+
+    logger.info(f"Profiling imports: {command}")
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", *command[1:]],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    records = parse_importtime(result.stderr)
+    if not records:
+        typer.secho("No import time data was collected.", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    typer.secho(f"{'cumul ms':>10} {'self ms':>10}  module", bold=True)
+    _print_import_tree(records, int(threshold * 1000))
+    total_us = sum(record.cumulative_us for record in records)
+    typer.echo(f"{total_us / 1000:10.1f} {'':>10}  total")
+
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, capture_output=True, check=False)  # noqa: S603
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    p95 = samples[math.ceil(0.95 * len(samples)) - 1]
+
+    typer.secho(
+        f"wall time over {runs} cold runs: "
+        f"min {samples[0]:.1f} ms, "
+        f"median {statistics.median(samples):.1f} ms, "
+        f"p95 {p95:.1f} ms",
+        bold=True,
+    )
@@ -0,0 +1,46 @@
+"""test the {{ cookiecutter.package_name }} benchmark harness."""
+
+import json
+from pathlib import Path
+
+from benchmarks.harness import compare, main, measure
+
+QUICK = ["--warmup", "1", "--rounds", "2", "--min-time", "0.001"]
+
+
+def test_measure() -> None:
+    """Test that a benchmark is warmed up and timed in calibrated rounds."""
+    calls = []
+    result = measure("append", lambda: calls.append(1), warmup=2, min_time=0.001)
+
+    assert result.rounds == 5
+    assert result.min <= result.median
+    assert len(calls) >= 2 + result.rounds * result.calls
+
+
+def test_compare_threshold() -> None:
+    """Test that only medians slower than the threshold are regressions."""
+    baseline = {"benchmarks": {"steady": {"median": 1.0}, "slower": {"median": 1.0}}}
+    current = {
+        "benchmarks": {
+            "steady": {"median": 1.05},
+            "slower": {"median": 1.5},
+            "new": {"median": 9.0},
+        }
+    }
+
+    regressions = compare(baseline, current, threshold=0.1)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("slower:")
+
+
+def test_main_output_and_compare(tmp_path: Path) -> None:
+    """Test that results are written as JSON and compared with a baseline."""
+    baseline = tmp_path / "baseline.json"
+
+    assert main(["--filter", "cli_help", *QUICK, "--output", str(baseline)]) == 0
+    assert list(json.loads(baseline.read_text())["benchmarks"]) == ["cli_help"]
+
+    compared = ["--compare", str(baseline), "--threshold", "100"]
+    assert main(["--filter", "cli_help", *QUICK, *compared]) == 0
@@ -1,7 +1,10 @@
 """test {{ cookiecutter.package_name }} CLI: {{ cookiecutter.cli_name }}."""
 
-from typer.testing import CliRunner
 import importlib
+import subprocess
+import sys
+
+from typer.testing import CliRunner
 
 main_module_name = "{{ cookiecutter.package_name }}.__main__"
 main_module = importlib.import_module(main_module_name)
@@ -39,3 +42,32 @@ def test_cli_self_version(project_version: str) -> None:
     result = runner.invoke(main_module.cli, ["self", "version"])
     assert result.exit_code == 0
     assert result.output.strip() == project_version
+
+
+def test_cli_subcommands_are_lazy() -> None:
+    """Test that importing the CLI does not import subcommand modules."""
+    code = (
+        f"import sys, {main_module_name};"
+        "assert '{{ cookiecutter.package_name }}.self_subcommand' not in sys.modules"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=False
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_cli_help_lists_lazy_subcommands() -> None:
+    """Test that lazy subcommands are listed in the main help."""
+    result = runner.invoke(main_module.cli, ["--help"])
+    assert result.exit_code == 0
+    assert "self" in result.output
+
+
+def test_cli_self_startup_profile() -> None:
+    """Test the startup-profile self subcommand."""
+    result = runner.invoke(
+        main_module.cli, ["self", "startup-profile", "--runs", "2", "--", "--help"]
+    )
+    assert result.exit_code == 0
+    assert "total" in result.output
+    assert "wall time over 2 cold runs" in result.output
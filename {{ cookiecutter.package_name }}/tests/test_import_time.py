@@ -0,0 +1,59 @@
+"""test {{ cookiecutter.package_name }} import time stays within budget.
+
+The budget is configured in the `[tool.{{ cookiecutter.package_name }}.perf]`
+table of pyproject.toml.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {{ cookiecutter.package_name }}.__main__
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+@pytest.fixture(scope="module")
+def perf_budget(pyproject_toml: dict) -> dict:
+    """Return the performance budget from pyproject.toml."""
+    return pyproject_toml["tool"]["{{ cookiecutter.package_name }}"]["perf"]
+
+
+@pytest.fixture(scope="module")
+def import_probes(perf_budget: dict) -> list[dict]:
+    """Import the CLI in several fresh interpreters and return the results."""
+    probes = []
+    for _ in range(perf_budget["import-runs"]):
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_PROBE],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        probes.append(json.loads(result.stdout))
+    return probes
+
+
+def test_import_time_budget(perf_budget: dict, import_probes: list[dict]) -> None:
+    """Test the median import time of the CLI is within budget."""
+    median_ms = statistics.median(probe["elapsed"] for probe in import_probes) * 1000
+    budget_ms = perf_budget["import-time-ms"]
+    assert median_ms <= budget_ms, (
+        f"median import time {median_ms:.1f} ms exceeds budget of {budget_ms} ms"
+    )
+
+
+def test_import_heavy_modules(perf_budget: dict, import_probes: list[dict]) -> None:
+    """Test the CLI does not import heavy modules at start up."""
+    imported = {name.partition(".")[0] for name in import_probes[0]["modules"]}
+    heavy = imported.intersection(perf_budget["heavy-modules"])
+    assert not heavy, f"heavy modules imported at start up: {sorted(heavy)}"
@@ -0,0 +1,57 @@
+"""test {{ cookiecutter.package_name }} span instrumentation."""
+
+import json
+from pathlib import Path
+
+from loguru import logger
+
+from {{ cookiecutter.package_name }} import instrument
+from {{ cookiecutter.package_name }}.instrument import span
+
+
+@span()
+def double(value: int) -> int:
+    """Return twice value."""
+    return value * 2
+
+
+def test_span_disabled() -> None:
+    """Test that spans record nothing while instrumentation is disabled."""
+    instrument.disable()
+    with span("block"):
+        assert double(2) == 4
+
+    assert not instrument.enabled()
+
+
+def test_span_log_summary() -> None:
+    """Test that span counts are logged when instrumentation is disabled."""
+    messages = []
+    logger.enable("{{ cookiecutter.package_name }}")
+    handler_id = logger.add(messages.append, format="{message}")
+    try:
+        instrument.enable()
+        for value in range(3):
+            with span("block"):
+                double(value)
+        instrument.disable()
+    finally:
+        logger.remove(handler_id)
+        logger.disable("{{ cookiecutter.package_name }}")
+
+    summary = "".join(messages)
+    assert "span block: count=3" in summary
+    assert "span double: count=3" in summary
+
+
+def test_span_chrome_trace(tmp_path: Path) -> None:
+    """Test that spans are written as complete events of a Chrome trace."""
+    path = tmp_path / "trace.json"
+    instrument.enable(str(path))
+    with span("outer"):
+        double(1)
+    instrument.disable()
+
+    events = json.loads(path.read_text())["traceEvents"]
+    assert [event["name"] for event in events] == ["double", "outer"]
+    assert all(event["ph"] == "X" for event in events)
@@ -0,0 +1,103 @@
+"""test {{ cookiecutter.package_name }} command profiling."""
+
+import pstats
+import signal
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from {{ cookiecutter.package_name }}.__main__ import cli
+from {{ cookiecutter.package_name }}.profiling import start_sampler
+
+runner = CliRunner()
+
+needs_setitimer = pytest.mark.skipif(
+    not hasattr(signal, "setitimer"),
+    reason="stack sampling needs signal.setitimer",
+)
+
+
+def test_cli_profile_output(tmp_path: Path) -> None:
+    """Test that the dispatched command is profiled to the given path."""
+    path = tmp_path / "version.pstats"
+    result = runner.invoke(
+        cli, ["--profile", "--profile-output", str(path), "self", "version"]
+    )
+
+    assert result.exit_code == 0
+    functions = {name for _, _, name in pstats.Stats(str(path)).stats}
+    assert "version_subcommand" in functions
+
+
+def test_cli_profile_debug_report(tmp_path: Path, monkeypatch) -> None:
+    """Test that --debug prints the top functions by cumulative time."""
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(cli, ["--profile", "--debug", "self", "version"])
+
+    assert result.exit_code == 0
+    assert (tmp_path / "{{ cookiecutter.package_name }}.pstats").exists()
+    assert "cumulative time" in result.stderr
+
+
+@needs_setitimer
+def test_start_sampler_folded_stacks(tmp_path: Path) -> None:
+    """Test that sampled stacks are written outermost frame first."""
+    path = tmp_path / "busy.folded"
+    stop = start_sampler(path, rate=1000)
+    deadline = time.process_time() + 0.1
+    while time.process_time() < deadline:
+        pass
+    stop()
+
+    stacks = dict(line.rsplit(" ", 1) for line in path.read_text().splitlines())
+    assert stacks
+    assert all(int(count) > 0 for count in stacks.values())
+    assert any(stack.endswith(":test_start_sampler_folded_stacks") for stack in stacks)
+
+
+@needs_setitimer
+def test_cli_profile_sample(tmp_path: Path) -> None:
+    """Test that --profile-sample writes folded stacks and restores SIGPROF."""
+    path = tmp_path / "version.folded"
+    handler = signal.getsignal(signal.SIGPROF)
+    result = runner.invoke(
+        cli, ["--profile-sample", "--profile-output", str(path), "self", "version"]
+    )
+
+    assert result.exit_code == 0
+    assert path.exists()
+    assert signal.getsignal(signal.SIGPROF) == handler
+
+
+def test_cli_memprofile_snapshot(tmp_path: Path) -> None:
+    """Test that --memprofile reports allocation sites and dumps a snapshot."""
+    path = tmp_path / "version.snapshot"
+    result = runner.invoke(
+        cli, ["--memprofile", "--profile-output", str(path), "self", "version"]
+    )
+
+    assert result.exit_code == 0
+    assert "peak traced" in result.stderr
+    assert "allocation sites by growth" in result.stderr
+    assert tracemalloc.Snapshot.load(str(path)).traces
+    assert not tracemalloc.is_tracing()
+
+
+def test_cli_profilers_are_exclusive() -> None:
+    """Test that only one profiler can be chosen."""
+    result = runner.invoke(cli, ["--profile", "--memprofile", "self", "version"])
+
+    assert result.exit_code == 2
+    assert not tracemalloc.is_tracing()
+
+
+def test_cli_profile_sample_unsupported(monkeypatch) -> None:
+    """Test that sampling without signal.setitimer is a usage error."""
+    monkeypatch.delattr(signal, "setitimer", raising=False)
+    result = runner.invoke(cli, ["--profile-sample", "self", "version"])
+
+    assert result.exit_code == 2
+    assert "setitimer" in result.output